@@ -10,6 +10,7 @@ from typing import Any, Dict, List, Optional
 
 from fastapi import FastAPI, HTTPException, Depends, Query, Path, Body
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
 
 from ucmp_connectors import (
@@ -20,7 +21,9 @@ from ucmp_connectors import (
     AuthType,
     ExecutionContext,
     ExecutionResult,
+    DeclarativeConnector,
 )
+from ucmp_connectors.connectors.twilio import TwilioConnector
 from ucmp_connectors.core.credentials import InMemoryCredentialBackend
 
 # Global instances
@@ -48,13 +51,15 @@ async def lifespan(app: FastAPI):
     backend = InMemoryCredentialBackend()
     cred_manager = CredentialManager(backend, encryption_key=encryption_key)
 
-    # Initialize schema registry
+    # Initialize schema registry and build schemas before the first request
     schema_registry = SchemaRegistry(registry)
+    schema_registry.warm_cache()
 
     yield
 
     # Cleanup
-    pass
+    await TwilioConnector.shutdown_all()
+    await DeclarativeConnector.shutdown_all()
 
 
 app = FastAPI(
@@ -64,6 +69,68 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+
+# =============================================================================
+# Middleware
+# =============================================================================
+
+class PreflightCacheMiddleware:
+    """
+    Replay CORS preflight responses without running the middleware stack.
+
+    The first preflight for a given origin / requested method / requested
+    headers combination is answered by CORSMiddleware as usual and its
+    response is captured; identical preflights afterwards are served from
+    memory. CORS handling does not depend on the path, so one entry covers
+    every route. Only successful responses are cached, and the cache is
+    bounded since the key comes from client-supplied headers.
+    """
+
+    max_entries = 256
+
+    def __init__(self, app):
+        self.app = app
+        self._responses: Dict[tuple, tuple] = {}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        if b"access-control-request-method" not in headers:
+            await self.app(scope, receive, send)
+            return
+
+        key = (
+            headers.get(b"origin"),
+            headers[b"access-control-request-method"],
+            headers.get(b"access-control-request-headers"),
+            headers.get(b"access-control-request-private-network"),
+        )
+        cached = self._responses.get(key)
+        if cached is not None:
+            for message in cached:
+                await send(message)
+            return
+
+        messages = []
+
+        async def capture(message):
+            messages.append(message)
+            await send(message)
+
+        await self.app(scope, receive, capture)
+
+        if (
+            len(messages) == 2
+            and messages[0].get("status") == 200
+            and not messages[1].get("more_body", False)
+            and len(self._responses) < self.max_entries
+        ):
+            self._responses[key] = (messages[0], messages[1])
+
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -73,6 +140,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Added last so it wraps CORSMiddleware and sees preflights first
+app.add_middleware(PreflightCacheMiddleware)
+
 
 # =============================================================================
 # Pydantic Models
@@ -259,10 +329,11 @@ async def get_action_schema(
     action_id: str = Path(..., description="Action ID"),
 ):
     """Get JSON schema for a specific action"""
-    schema = schema_registry.get_action_schema(connector_id, action_id)
-    if not schema:
+    # Served pre-serialized from the schema registry's cache
+    schema_json = schema_registry.get_action_schema_json(connector_id, action_id)
+    if not schema_json:
         raise HTTPException(status_code=404, detail=f"Action not found: {connector_id}/{action_id}")
-    return schema
+    return Response(content=schema_json, media_type="application/json")
 
 
 # =============================================================================
@@ -477,4 +548,16 @@ async def health_check():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8002)
+
+    # uvloop + httptools ship with uvicorn[standard]; request them explicitly
+    # so a missing dependency fails loudly instead of silently falling back.
+    # Multiple workers require an import string rather than the app object.
+    workers = int(os.environ.get("WORKERS", "1"))
+    uvicorn.run(
+        "main:app" if workers > 1 else app,
+        host="0.0.0.0",
+        port=8002,
+        loop="uvloop",
+        http="httptools",
+        workers=workers,
+    )
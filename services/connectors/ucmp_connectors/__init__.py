@@ -19,12 +19,13 @@ Quick Start:
         credentials={"account_sid": "AC...", "auth_token": "..."}
     ))
 
-    # Execute action
-    result = await twilio.execute_action(
-        "send_sms",
-        {"to": "+1555...", "from_number": "+1555...", "body": "Hello!"},
-        ExecutionContext()
-    )
+    # Execute action (the context manager authenticates and closes the client)
+    async with twilio:
+        result = await twilio.execute_action(
+            "send_sms",
+            {"to": "+1555...", "from_number": "+1555...", "body": "Hello!"},
+            ExecutionContext()
+        )
 
 For Temporal Integration:
 ------------------------
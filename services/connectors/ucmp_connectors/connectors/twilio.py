@@ -4,12 +4,19 @@ Twilio Connector
 Full-featured Twilio integration for SMS, Voice, and more.
 """
 
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple, Callable, Awaitable, AsyncIterator
+from datetime import datetime, timezone
 import asyncio
+import functools
+import os
+import random
+import re
+import time
 import httpx
 import base64
+import json
 import logging
+from urllib.parse import urlencode
 
 from ..core.base import (
     ConnectorBase,
@@ -31,6 +38,63 @@ from ..core.registry import register_connector
 
 logger = logging.getLogger(__name__)
 
+# Connection pool sizing. Keep-alive connections should cover the expected
+# number of in-flight requests so bursts reuse TLS sessions instead of
+# opening new ones.
+POOL_SIZE = int(os.environ.get("TWILIO_POOL_SIZE", "200"))
+POOL_KEEPALIVE = int(os.environ.get("TWILIO_POOL_KEEPALIVE", "100"))
+
+# HTTP/2 lets concurrent requests share one connection; needs the h2 package
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# orjson parses large message listings several times faster than json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Maximum in-flight HTTP requests per connector instance
+MAX_CONCURRENT_REQUESTS = int(os.environ.get("TWILIO_MAX_CONCURRENT", "20"))
+
+# Retries for throttled (429) and, on GETs, server-error responses. Backoff
+# doubles from RETRY_BASE_DELAY with jitter and honours Retry-After; a
+# Retry-After beyond RETRY_MAX_DELAY is surfaced as RateLimitError instead.
+MAX_RETRIES = int(os.environ.get("TWILIO_MAX_RETRIES", "4"))
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 30.0
+
+# Messages per asyncio.gather in send_sms_batch. A small multiple of the
+# concurrency cap keeps the request limiter saturated without creating one
+# coroutine per message for very large campaigns.
+SMS_BATCH_CHUNK_SIZE = 50
+
+_ACCOUNT_SID_RE = re.compile(r"^AC[a-f0-9]{32}$")
+
+_FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+# Clients shared by every connector instance using the same credentials, so
+# concurrent flows for one account reuse a single pool and TLS session.
+# (account_sid, auth_token) -> [client, number of instances holding it]
+_SHARED_CLIENTS: Dict[Tuple[str, str], list] = {}
+
+# Phone number inventory rarely changes, so dropdown renders reuse a recent
+# listing instead of calling the API every time.
+# Keyed by the full credentials so only a caller holding the same token
+# is served an entry fetched with it.
+# (account_sid, auth_token) -> (fetched_at, phone_numbers, raw_response)
+PHONE_NUMBER_CACHE_TTL = 300.0
+_PHONE_NUMBER_CACHE: Dict[Tuple[str, str], Tuple[float, List[Dict[str, Any]], Dict[str, Any]]] = {}
+
+# Credentials verified recently, so new connector instances skip the probe.
+# (account_sid, auth_token) -> verified_at; evicted on any 401.
+AUTH_CACHE_TTL = 3600.0
+_AUTH_CACHE: Dict[Tuple[str, str], float] = {}
+
 
 @register_connector
 class TwilioConnector(ConnectorBase):
@@ -46,17 +110,33 @@ class TwilioConnector(ConnectorBase):
     - Webhook triggers for incoming messages/calls
     """
     
-    BASE_URL = "https://api.twilio.com/2010-04-01"
+    API_ROOT = "https://api.twilio.com"
+    BASE_URL = f"{API_ROOT}/2010-04-01"
     
     def __init__(self, auth_config: Optional[AuthConfig] = None):
         super().__init__(auth_config)
         self._client: Optional[httpx.AsyncClient] = None
+        self._client_key: Optional[Tuple[str, str]] = None
+        self._request_limiter = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._set_account(auth_config.credentials.get("account_sid", "") if auth_config else "")
+        self._action_handlers: Dict[str, Callable[[Dict[str, Any]], Awaitable[ExecutionResult]]] = {
+            "send_sms": self._send_sms,
+            "send_mms": self._send_mms,
+            "make_call": self._make_call,
+            "list_messages": self._list_messages,
+            "list_phone_numbers": lambda inputs: self._list_phone_numbers(),
+            "lookup_phone": self._lookup_phone,
+        }
     
     # -------------------------------------------------------------------------
     # Metadata
     # -------------------------------------------------------------------------
     
+    # Definitions are static, so each is built once per class and shared.
+    # Callers must treat the returned objects as read-only.
+    
     @classmethod
+    @functools.cache
     def get_metadata(cls) -> ConnectorMetadata:
         return ConnectorMetadata(
             id="twilio",
@@ -77,7 +157,7 @@ class TwilioConnector(ConnectorBase):
                         required=True,
                         description="Your Twilio Account SID (starts with AC)",
                         placeholder="ACxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx",
-                        validation_regex=r"^AC[a-f0-9]{32}$"
+                        validation_regex=_ACCOUNT_SID_RE.pattern
                     ),
                     FieldDefinition(
                         name="auth_token",
@@ -97,7 +177,9 @@ class TwilioConnector(ConnectorBase):
     # Actions
     # -------------------------------------------------------------------------
     
-    def get_actions(self) -> List[ActionDefinition]:
+    @classmethod
+    @functools.cache
+    def get_actions(cls) -> List[ActionDefinition]:
         return [
             ActionDefinition(
                 id="send_sms",
@@ -261,6 +343,13 @@ class TwilioConnector(ConnectorBase):
                         min_value=1,
                         max_value=1000
                     ),
+                    FieldDefinition(
+                        name="all_pages",
+                        label="All Pages",
+                        type=FieldType.BOOLEAN,
+                        default=False,
+                        description="Follow pagination and return every matching message"
+                    ),
                 ],
                 outputs=[
                     FieldDefinition(name="messages", label="Messages", type=FieldType.ARRAY),
@@ -318,7 +407,9 @@ class TwilioConnector(ConnectorBase):
     # Triggers
     # -------------------------------------------------------------------------
     
-    def get_triggers(self) -> List[TriggerDefinition]:
+    @classmethod
+    @functools.cache
+    def get_triggers(cls) -> List[TriggerDefinition]:
         return [
             TriggerDefinition(
                 id="incoming_sms",
@@ -405,34 +496,118 @@ class TwilioConnector(ConnectorBase):
         if not account_sid or not auth_token:
             raise AuthenticationError("Account SID and Auth Token are required")
         
-        # Test credentials by fetching account info
-        client = await self._get_client()
+        # Reject malformed SIDs without a round-trip to Twilio
+        if not _ACCOUNT_SID_RE.match(account_sid):
+            raise AuthenticationError("Invalid Account SID format (expected AC followed by 32 hex characters)")
+        
+        self._set_account(account_sid)
+        
+        key = (account_sid, auth_token)
+        verified_at = _AUTH_CACHE.get(key)
+        if verified_at is not None and time.monotonic() - verified_at < AUTH_CACHE_TTL:
+            self._authenticated = True
+            return True
         
+        # Test credentials by fetching account info
         try:
-            response = await client.get(f"{self.BASE_URL}/Accounts/{account_sid}.json")
+            response = await self._request("GET", f"{self._account_url}.json")
             
             if response.status_code == 401:
                 raise AuthenticationError("Invalid Account SID or Auth Token")
             
             response.raise_for_status()
+            _AUTH_CACHE[key] = time.monotonic()
             self._authenticated = True
             return True
             
         except httpx.HTTPStatusError as e:
             raise AuthenticationError(f"Authentication failed: {e}")
     
+    def _set_account(self, account_sid: str):
+        """Precompute the account's resource URLs so requests skip the formatting"""
+        self._account_sid = account_sid
+        self._account_url = f"{self.BASE_URL}/Accounts/{account_sid}"
+        self._messages_url = f"{self._account_url}/Messages.json"
+        self._calls_url = f"{self._account_url}/Calls.json"
+        self._incoming_numbers_url = f"{self._account_url}/IncomingPhoneNumbers.json"
+    
+    def _credentials_key(self) -> Tuple[str, str]:
+        """(account_sid, auth_token) key for the per-credential module caches"""
+        creds = self.auth_config.credentials if self.auth_config else {}
+        return creds.get("account_sid", ""), creds.get("auth_token", "")
+    
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client with auth"""
+        """Get the shared HTTP client for these credentials, creating it if needed"""
         if self._client is None:
-            account_sid = self.auth_config.credentials.get("account_sid", "")
-            auth_token = self.auth_config.credentials.get("auth_token", "")
+            key = self._credentials_key()
+            account_sid, auth_token = key
             
-            self._client = httpx.AsyncClient(
-                auth=(account_sid, auth_token),
-                timeout=30.0
-            )
+            # No await between lookup and insert, so no lock is needed
+            entry = _SHARED_CLIENTS.get(key)
+            if entry is None or entry[0].is_closed:
+                entry = _SHARED_CLIENTS[key] = [self._create_client(account_sid, auth_token), 0]
+            entry[1] += 1
+            
+            self._client = entry[0]
+            self._client_key = key
         return self._client
     
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request on the shared client, bounded by the per-connector concurrency cap"""
+        client = await self._get_client()
+        for attempt in range(MAX_RETRIES + 1):
+            async with self._request_limiter:
+                response = await client.request(method, url, **kwargs)
+            
+            if attempt == MAX_RETRIES:
+                break
+            delay = self._retry_delay(method, response, attempt)
+            if delay is None:
+                break
+            # Sleep outside the limiter so other requests can proceed
+            await asyncio.sleep(delay)
+        
+        if response.status_code == 401:
+            # Credentials were revoked or rotated; force the next action to re-verify
+            _AUTH_CACHE.pop(self._client_key, None)
+            self._authenticated = False
+        return response
+    
+    @staticmethod
+    def _retry_delay(method: str, response: httpx.Response, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying, or None if the response should be returned"""
+        status = response.status_code
+        # Only GETs are retried on 5xx; a POST may already have sent the message
+        if status != 429 and not (status >= 500 and method == "GET"):
+            return None
+        
+        delay = RETRY_BASE_DELAY * 2 ** attempt + random.uniform(0, RETRY_BASE_DELAY)
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            delay = max(delay, float(retry_after))
+        return delay if delay <= RETRY_MAX_DELAY else None
+    
+    async def _post_form(self, url: str, data: Dict[str, Any]) -> httpx.Response:
+        """POST a flat form body, encoded directly rather than through httpx's multipart-aware encoder"""
+        return await self._request("POST", url, content=urlencode(data).encode(), headers=_FORM_HEADERS)
+    
+    @staticmethod
+    def _create_client(account_sid: str, auth_token: str) -> httpx.AsyncClient:
+        """Create an HTTP client with auth and pool settings"""
+        # Credentials are fixed per client, so encode the Basic header once
+        # rather than letting httpx's auth flow rebuild it on every request
+        token = base64.b64encode(f"{account_sid}:{auth_token}".encode()).decode()
+        return httpx.AsyncClient(
+            headers={"Authorization": f"Basic {token}", "Accept": "application/json"},
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=POOL_SIZE,
+                max_keepalive_connections=POOL_KEEPALIVE,
+                keepalive_expiry=60.0
+            )
+        )
+    
     # -------------------------------------------------------------------------
     # Action Execution
     # -------------------------------------------------------------------------
@@ -444,32 +619,22 @@ class TwilioConnector(ConnectorBase):
         context: ExecutionContext
     ) -> ExecutionResult:
         """Execute a Twilio action"""
-        import time
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         await self.ensure_authenticated()
         
+        handler = self._action_handlers.get(action_id)
+        if handler is None:
+            return ExecutionResult(
+                success=False,
+                error_message=f"Unknown action: {action_id}",
+                error_code="UNKNOWN_ACTION"
+            )
+        
         try:
-            if action_id == "send_sms":
-                result = await self._send_sms(inputs)
-            elif action_id == "send_mms":
-                result = await self._send_mms(inputs)
-            elif action_id == "make_call":
-                result = await self._make_call(inputs)
-            elif action_id == "list_messages":
-                result = await self._list_messages(inputs)
-            elif action_id == "list_phone_numbers":
-                result = await self._list_phone_numbers()
-            elif action_id == "lookup_phone":
-                result = await self._lookup_phone(inputs)
-            else:
-                return ExecutionResult(
-                    success=False,
-                    error_message=f"Unknown action: {action_id}",
-                    error_code="UNKNOWN_ACTION"
-                )
+            result = await handler(inputs)
             
-            execution_time_ms = int((time.time() - start_time) * 1000)
+            execution_time_ms = int((time.perf_counter() - start_time) * 1000)
             result.execution_time_ms = execution_time_ms
             return result
             
@@ -481,29 +646,22 @@ class TwilioConnector(ConnectorBase):
                 success=False,
                 error_message=str(e),
                 error_code="EXECUTION_ERROR",
-                execution_time_ms=int((time.time() - start_time) * 1000)
+                execution_time_ms=int((time.perf_counter() - start_time) * 1000)
             )
     
     async def _send_sms(self, inputs: Dict[str, Any]) -> ExecutionResult:
         """Send an SMS message"""
-        account_sid = self.auth_config.credentials["account_sid"]
-        client = await self._get_client()
-        
         data = {
             "To": inputs["to"],
             "From": inputs["from_number"],
             "Body": inputs["body"]
         }
         
-        response = await client.post(
-            f"{self.BASE_URL}/Accounts/{account_sid}/Messages.json",
-            data=data
-        )
+        response = await self._post_form(self._messages_url, data)
         
-        self._check_rate_limit(response)
-        response.raise_for_status()
+        self._check_response(response)
         
-        result = response.json()
+        result = _json_loads(response.content)
         return ExecutionResult(
             success=True,
             data={
@@ -516,9 +674,6 @@ class TwilioConnector(ConnectorBase):
     
     async def _send_mms(self, inputs: Dict[str, Any]) -> ExecutionResult:
         """Send an MMS message"""
-        account_sid = self.auth_config.credentials["account_sid"]
-        client = await self._get_client()
-        
         data = {
             "To": inputs["to"],
             "From": inputs["from_number"],
@@ -527,15 +682,11 @@ class TwilioConnector(ConnectorBase):
         if inputs.get("body"):
             data["Body"] = inputs["body"]
         
-        response = await client.post(
-            f"{self.BASE_URL}/Accounts/{account_sid}/Messages.json",
-            data=data
-        )
+        response = await self._post_form(self._messages_url, data)
         
-        self._check_rate_limit(response)
-        response.raise_for_status()
+        self._check_response(response)
         
-        result = response.json()
+        result = _json_loads(response.content)
         return ExecutionResult(
             success=True,
             data={"sid": result["sid"], "status": result["status"]},
@@ -544,9 +695,6 @@ class TwilioConnector(ConnectorBase):
     
     async def _make_call(self, inputs: Dict[str, Any]) -> ExecutionResult:
         """Initiate a voice call"""
-        account_sid = self.auth_config.credentials["account_sid"]
-        client = await self._get_client()
-        
         data = {
             "To": inputs["to"],
             "From": inputs["from_number"],
@@ -563,15 +711,11 @@ class TwilioConnector(ConnectorBase):
         if inputs.get("record"):
             data["Record"] = "true"
         
-        response = await client.post(
-            f"{self.BASE_URL}/Accounts/{account_sid}/Calls.json",
-            data=data
-        )
+        response = await self._post_form(self._calls_url, data)
         
-        self._check_rate_limit(response)
-        response.raise_for_status()
+        self._check_response(response)
         
-        result = response.json()
+        result = _json_loads(response.content)
         return ExecutionResult(
             success=True,
             data={"sid": result["sid"], "status": result["status"]},
@@ -580,9 +724,6 @@ class TwilioConnector(ConnectorBase):
     
     async def _list_messages(self, inputs: Dict[str, Any]) -> ExecutionResult:
         """List messages"""
-        account_sid = self.auth_config.credentials["account_sid"]
-        client = await self._get_client()
-        
         params = {"PageSize": inputs.get("page_size", 50)}
         if inputs.get("to"):
             params["To"] = inputs["to"]
@@ -591,15 +732,25 @@ class TwilioConnector(ConnectorBase):
         if inputs.get("date_sent_after"):
             params["DateSent>"] = inputs["date_sent_after"]
         
-        response = await client.get(
-            f"{self.BASE_URL}/Accounts/{account_sid}/Messages.json",
+        if inputs.get("all_pages"):
+            messages = [message async for message in self._iter_messages(params)]
+            return ExecutionResult(
+                success=True,
+                data={
+                    "messages": messages,
+                    "total": len(messages)
+                }
+            )
+        
+        response = await self._request(
+            "GET",
+            self._messages_url,
             params=params
         )
         
-        self._check_rate_limit(response)
-        response.raise_for_status()
+        self._check_response(response)
         
-        result = response.json()
+        result = _json_loads(response.content)
         messages = result.get("messages", [])
         
         return ExecutionResult(
@@ -608,24 +759,51 @@ class TwilioConnector(ConnectorBase):
                 "messages": messages,
                 "total": len(messages)
             },
-            has_more="next_page_uri" in result,
+            has_more=bool(result.get("next_page_uri")),
             cursor=result.get("next_page_uri"),
             raw_response=result
         )
     
+    async def _iter_messages(
+        self,
+        params: Optional[Dict[str, Any]],
+        url: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield messages across all pages, following next_page_uri"""
+        url = url or self._messages_url
+        while url:
+            response = await self._request("GET", url, params=params)
+            
+            self._check_response(response)
+            
+            result = _json_loads(response.content)
+            for message in result.get("messages", []):
+                yield message
+            
+            # next_page_uri is relative and already carries the query
+            next_page_uri = result.get("next_page_uri")
+            url = f"{self.API_ROOT}{next_page_uri}" if next_page_uri else None
+            params = None
+    
     async def _list_phone_numbers(self) -> ExecutionResult:
-        """List phone numbers"""
-        account_sid = self.auth_config.credentials["account_sid"]
-        client = await self._get_client()
+        """List phone numbers (cached per credentials for PHONE_NUMBER_CACHE_TTL seconds)"""
+        cache_key = self._credentials_key()
+        cached = _PHONE_NUMBER_CACHE.get(cache_key)
+        if cached and time.monotonic() - cached[0] < PHONE_NUMBER_CACHE_TTL:
+            return ExecutionResult(
+                success=True,
+                data={"phone_numbers": cached[1]},
+                raw_response=cached[2]
+            )
         
-        response = await client.get(
-            f"{self.BASE_URL}/Accounts/{account_sid}/IncomingPhoneNumbers.json"
+        response = await self._request(
+            "GET",
+            self._incoming_numbers_url
         )
         
-        self._check_rate_limit(response)
-        response.raise_for_status()
+        self._check_response(response)
         
-        result = response.json()
+        result = _json_loads(response.content)
         phone_numbers = [
             {
                 "sid": pn["sid"],
@@ -635,6 +813,7 @@ class TwilioConnector(ConnectorBase):
             }
             for pn in result.get("incoming_phone_numbers", [])
         ]
+        _PHONE_NUMBER_CACHE[cache_key] = (time.monotonic(), phone_numbers, result)
         
         return ExecutionResult(
             success=True,
@@ -644,8 +823,6 @@ class TwilioConnector(ConnectorBase):
     
     async def _lookup_phone(self, inputs: Dict[str, Any]) -> ExecutionResult:
         """Lookup phone number information"""
-        client = await self._get_client()
-        
         phone_number = inputs["phone_number"]
         lookup_types = inputs.get("type", [])
         
@@ -654,15 +831,15 @@ class TwilioConnector(ConnectorBase):
             params["Type"] = ",".join(lookup_types)
         
         # Twilio Lookup API
-        response = await client.get(
+        response = await self._request(
+            "GET",
             f"https://lookups.twilio.com/v1/PhoneNumbers/{phone_number}",
             params=params
         )
         
-        self._check_rate_limit(response)
-        response.raise_for_status()
+        self._check_response(response)
         
-        result = response.json()
+        result = _json_loads(response.content)
         return ExecutionResult(
             success=True,
             data={
@@ -674,6 +851,42 @@ class TwilioConnector(ConnectorBase):
             raw_response=result
         )
     
+    # -------------------------------------------------------------------------
+    # Batch Operations
+    # -------------------------------------------------------------------------
+    
+    async def send_sms_batch(
+        self,
+        messages: List[Dict[str, Any]],
+        chunk_size: int = SMS_BATCH_CHUNK_SIZE
+    ) -> List[ExecutionResult]:
+        """
+        Send many SMS messages concurrently.
+        
+        Each item takes the same inputs as the send_sms action. Results are
+        returned in input order; a failed send yields an unsuccessful result
+        instead of aborting the batch. In-flight requests stay bounded by
+        TWILIO_MAX_CONCURRENT regardless of chunk_size.
+        """
+        await self.ensure_authenticated()
+        
+        results: List[ExecutionResult] = []
+        for i in range(0, len(messages), chunk_size):
+            outcomes = await asyncio.gather(
+                *(self._send_sms(message) for message in messages[i:i + chunk_size]),
+                return_exceptions=True
+            )
+            for outcome in outcomes:
+                if isinstance(outcome, ExecutionResult):
+                    results.append(outcome)
+                else:
+                    results.append(ExecutionResult(
+                        success=False,
+                        error_message=str(outcome),
+                        error_code="RATE_LIMITED" if isinstance(outcome, RateLimitError) else "EXECUTION_ERROR"
+                    ))
+        return results
+    
     # -------------------------------------------------------------------------
     # Triggers
     # -------------------------------------------------------------------------
@@ -685,9 +898,6 @@ class TwilioConnector(ConnectorBase):
         config: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Configure webhook on a Twilio phone number"""
-        account_sid = self.auth_config.credentials["account_sid"]
-        client = await self._get_client()
-        
         phone_number_sid = config.get("phone_number")
         
         if trigger_id == "incoming_sms":
@@ -697,11 +907,15 @@ class TwilioConnector(ConnectorBase):
         else:
             raise ValueError(f"Unknown trigger: {trigger_id}")
         
-        response = await client.post(
-            f"{self.BASE_URL}/Accounts/{account_sid}/IncomingPhoneNumbers/{phone_number_sid}.json",
-            data=data
+        response = await self._post_form(
+            f"{self._account_url}/IncomingPhoneNumbers/{phone_number_sid}.json",
+            data
         )
-        response.raise_for_status()
+        self._check_response(response)
+        
+        # The number's configuration changed; drop the account's cached listings
+        for key in [k for k in _PHONE_NUMBER_CACHE if k[0] == self._account_sid]:
+            del _PHONE_NUMBER_CACHE[key]
         
         return {
             "webhook_id": phone_number_sid,
@@ -718,9 +932,6 @@ class TwilioConnector(ConnectorBase):
         if trigger_id != "new_messages":
             return [], last_poll_state or {}
         
-        account_sid = self.auth_config.credentials["account_sid"]
-        client = await self._get_client()
-        
         # Get last checked timestamp
         last_checked = last_poll_state.get("last_checked") if last_poll_state else None
         
@@ -732,19 +943,40 @@ class TwilioConnector(ConnectorBase):
         if direction != "all":
             params["Direction"] = direction
         
-        response = await client.get(
-            f"{self.BASE_URL}/Accounts/{account_sid}/Messages.json",
-            params=params
-        )
-        response.raise_for_status()
+        # Conditional request: an idle account answers 304 with no body
+        headers = {}
+        if last_poll_state:
+            if last_poll_state.get("etag"):
+                headers["If-None-Match"] = last_poll_state["etag"]
+            if last_poll_state.get("last_modified"):
+                headers["If-Modified-Since"] = last_poll_state["last_modified"]
         
-        result = response.json()
+        # Taken before the request so messages sent while it is in flight are
+        # picked up by the next poll
+        now = datetime.now(timezone.utc)
+        
+        response = await self._request("GET", self._messages_url, params=params, headers=headers)
+        if response.status_code == 304:
+            return [], last_poll_state
+        
+        self._check_response(response)
+        
+        result = _json_loads(response.content)
         messages = result.get("messages", [])
+        next_page_uri = result.get("next_page_uri")
+        if next_page_uri:
+            messages.extend([
+                message async for message in self._iter_messages(None, f"{self.API_ROOT}{next_page_uri}")
+            ])
         
         # Update poll state
         new_state = {
-            "last_checked": datetime.utcnow().strftime("%Y-%m-%d")
+            "last_checked": now.strftime("%Y-%m-%dT%H:%M:%SZ")
         }
+        if "Date" in response.headers:
+            new_state["last_modified"] = response.headers["Date"]
+        if "ETag" in response.headers:
+            new_state["etag"] = response.headers["ETag"]
         
         return messages, new_state
     
@@ -771,18 +1003,36 @@ class TwilioConnector(ConnectorBase):
     # Helpers
     # -------------------------------------------------------------------------
     
-    def _check_rate_limit(self, response: httpx.Response):
-        """Check for rate limiting"""
-        if response.status_code == 429:
+    def _check_response(self, response: httpx.Response):
+        """Raise RateLimitError on 429 and HTTPStatusError on other error statuses"""
+        status = response.status_code
+        if status < 400:
+            return
+        if status == 429:
             retry_after = int(response.headers.get("Retry-After", 60))
             raise RateLimitError(
                 "Twilio rate limit exceeded",
                 retry_after=retry_after,
                 connector_id="twilio"
             )
+        response.raise_for_status()
     
     async def close(self):
-        """Close HTTP client"""
+        """Release the shared HTTP client, closing it once no instance holds it"""
         if self._client:
-            await self._client.aclose()
+            entry = _SHARED_CLIENTS.get(self._client_key)
+            if entry is not None and entry[0] is self._client:
+                entry[1] -= 1
+                if entry[1] <= 0:
+                    del _SHARED_CLIENTS[self._client_key]
+                    await self._client.aclose()
             self._client = None
+            self._client_key = None
+    
+    @classmethod
+    async def shutdown_all(cls):
+        """Close every shared HTTP client (call on application shutdown)"""
+        clients = [entry[0] for entry in _SHARED_CLIENTS.values()]
+        _SHARED_CLIENTS.clear()
+        for client in clients:
+            await client.aclose()
@@ -4,16 +4,44 @@ Base Connector Classes and Core Abstractions
 """
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field, asdict
 from enum import Enum
-from typing import Any, Dict, List, Optional, Callable, Type
+from typing import Any, Dict, List, Optional, Callable, Tuple, Type
 from datetime import datetime
-from pydantic import BaseModel, Field
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from string import Formatter
+from types import MappingProxyType
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 import asyncio
+import base64
+import functools
+import json
 import logging
+import re
+import time
+import httpx
 
 logger = logging.getLogger(__name__)
 
 
+class _NoCookiesPolicy(DefaultCookiePolicy):
+    """Cookie policy that never stores or sends cookies"""
+    
+    def set_ok(self, cookie, request) -> bool:
+        return False
+    
+    def return_ok(self, cookie, request) -> bool:
+        return False
+
+
+# orjson parses manifests several times faster than json when installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
 # =============================================================================
 # Enums
 # =============================================================================
@@ -61,11 +89,15 @@ class FieldType(str, Enum):
 # Exception Classes
 # =============================================================================
 
+# Shared read-only stand-in for absent error details / field errors
+_EMPTY_DICT = MappingProxyType({})
+
+
 class ConnectorError(Exception):
     """Base exception for connector errors"""
     def __init__(self, message: str, connector_id: str = None, details: dict = None):
         self.connector_id = connector_id
-        self.details = details or {}
+        self.details = details if details is not None else _EMPTY_DICT
         super().__init__(message)
 
 
@@ -84,7 +116,7 @@ class RateLimitError(ConnectorError):
 class ValidationError(ConnectorError):
     """Input validation failed"""
     def __init__(self, message: str, field_errors: dict = None, **kwargs):
-        self.field_errors = field_errors or {}
+        self.field_errors = field_errors if field_errors is not None else _EMPTY_DICT
         super().__init__(message, **kwargs)
 
 
@@ -110,8 +142,11 @@ class FieldDefinition(BaseModel):
     min_length: Optional[int] = None
     max_length: Optional[int] = None
 
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True, frozen=True, extra="ignore")
+
+
+# Validates a whole list of field dicts in one pydantic-core call
+_FIELD_LIST_ADAPTER = TypeAdapter(List[FieldDefinition])
 
 
 class AuthConfig(BaseModel):
@@ -124,8 +159,7 @@ class AuthConfig(BaseModel):
     refresh_token: Optional[str] = None
     token_expires_at: Optional[datetime] = None
     
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
 
 
 class AuthSchemaDefinition(BaseModel):
@@ -134,8 +168,7 @@ class AuthSchemaDefinition(BaseModel):
     fields: List[FieldDefinition] = []
     oauth2_config: Optional[Dict[str, Any]] = None  # auth_url, token_url, scopes, etc.
     
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True, frozen=True, extra="ignore")
 
 
 class ActionDefinition(BaseModel):
@@ -152,6 +185,8 @@ class ActionDefinition(BaseModel):
     is_idempotent: bool = False             # Safe to retry
     estimated_duration_ms: int = 1000       # For timeout estimation
     rate_limit_weight: int = 1              # For rate limiting
+    
+    model_config = ConfigDict(frozen=True, extra="ignore")
 
 
 class TriggerDefinition(BaseModel):
@@ -169,8 +204,7 @@ class TriggerDefinition(BaseModel):
     default_poll_interval_seconds: int = 300
     min_poll_interval_seconds: int = 60
     
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True, frozen=True, extra="ignore")
 
 
 class ConnectorMetadata(BaseModel):
@@ -193,9 +227,15 @@ class ConnectorMetadata(BaseModel):
     supports_test_connection: bool = True
     supports_webhooks: bool = False
     base_url: Optional[str] = None          # For display/documentation
+    
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
 
+# Execution context/result are built on every action call and only carry
+# plain data, so they are slotted dataclasses rather than validated models.
 
-class ExecutionContext(BaseModel):
+@dataclass(slots=True)
+class ExecutionContext:
     """Context passed to action/trigger execution"""
     workflow_id: Optional[str] = None
     workflow_run_id: Optional[str] = None
@@ -212,31 +252,58 @@ class ExecutionContext(BaseModel):
     max_retries: int = 3
     
     # Additional context
-    variables: Dict[str, Any] = {}          # Workflow variables
-    metadata: Dict[str, Any] = {}
+    variables: Dict[str, Any] = field(default_factory=dict)  # Workflow variables
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
 
 
-class ExecutionResult(BaseModel):
+@dataclass(slots=True)
+class ExecutionResult:
     """Result from action/trigger execution"""
     success: bool
-    data: Dict[str, Any] = {}
+    data: Dict[str, Any] = field(default_factory=dict)
     error_message: Optional[str] = None
     error_code: Optional[str] = None
     
     # Metadata
     execution_time_ms: int = 0
     rate_limit_remaining: Optional[int] = None
-    raw_response: Optional[Dict[str, Any]] = None  # Original API response
+    raw_response: Optional[Dict[str, Any]] = None  # Original API response (declarative: opt-in via include_raw_response)
     
     # For pagination
     has_more: bool = False
     cursor: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
 
 
 # =============================================================================
 # Base Connector Class
 # =============================================================================
 
+# Input type checks used by validate_inputs: type -> (predicate, error message).
+# bool is a subclass of int, so it is excluded explicitly for numeric types.
+_TYPE_CHECKERS: Dict[str, Tuple[Callable[[Any], bool], str]] = {
+    FieldType.INTEGER: (lambda v: isinstance(v, int) and not isinstance(v, bool), "Must be an integer"),
+    FieldType.NUMBER: (lambda v: isinstance(v, (int, float)) and not isinstance(v, bool), "Must be a number"),
+    FieldType.BOOLEAN: (lambda v: isinstance(v, bool), "Must be a boolean"),
+}
+
+
+# Compiled field.validation_regex patterns, shared by all connectors. Patterns
+# come from manifests, so the cache is bounded.
+_REGEX_CACHE_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=_REGEX_CACHE_SIZE)
+def _compile(pattern: str) -> "re.Pattern[str]":
+    """Compile a validation regex once and reuse it"""
+    return re.compile(pattern)
+
+
 class ConnectorBase(ABC):
     """
     Base class for all connectors.
@@ -244,11 +311,16 @@ class ConnectorBase(ABC):
     Implement this class to create a new integration.
     """
     
+    # get_metadata() results, built once per connector class
+    _metadata_cache: Dict[type, ConnectorMetadata] = {}
+    
     def __init__(self, auth_config: Optional[AuthConfig] = None):
         self.auth_config = auth_config
         self._authenticated = False
         self._rate_limiter: Optional[asyncio.Semaphore] = None
         self._http_client = None
+        self._actions_by_id: Optional[Dict[str, ActionDefinition]] = None
+        self._action_validation_spec: Dict[str, Tuple[tuple, ...]] = {}
         
     # -------------------------------------------------------------------------
     # Abstract Methods - Must Implement
@@ -283,6 +355,14 @@ class ConnectorBase(ABC):
         """Execute an action and return the result"""
         pass
     
+    @classmethod
+    def get_metadata_cached(cls) -> ConnectorMetadata:
+        """Return get_metadata(), building it only on the first call per class"""
+        metadata = ConnectorBase._metadata_cache.get(cls)
+        if metadata is None:
+            metadata = ConnectorBase._metadata_cache[cls] = cls.get_metadata()
+        return metadata
+    
     # -------------------------------------------------------------------------
     # Optional Methods - Override as Needed
     # -------------------------------------------------------------------------
@@ -357,59 +437,183 @@ class ConnectorBase(ABC):
             await self.authenticate()
             self._authenticated = True
     
+    async def execute_actions(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]],
+        context: Optional[ExecutionContext] = None,
+        concurrency: int = 10
+    ) -> List[ExecutionResult]:
+        """
+        Execute several (action_id, inputs) calls concurrently.
+        
+        In-flight calls are bounded by the connector's rate limiter, created
+        with `concurrency` slots on first use. Results are returned in call order.
+        """
+        if self._rate_limiter is None:
+            self._rate_limiter = asyncio.Semaphore(concurrency)
+        limiter = self._rate_limiter
+        context = context or ExecutionContext()
+        
+        async def run(action_id: str, inputs: Dict[str, Any]) -> ExecutionResult:
+            async with limiter:
+                return await self.execute_action(action_id, inputs, context)
+        
+        return await asyncio.gather(*(run(action_id, inputs) for action_id, inputs in calls))
+    
+    def _get_action(self, action_id: str) -> Optional[ActionDefinition]:
+        """Look up an action definition by id (index built on first use)"""
+        if self._actions_by_id is None:
+            self._actions_by_id = {a.id: a for a in self.get_actions()}
+        return self._actions_by_id.get(action_id)
+    
+    def _get_validation_spec(self, action_id: str) -> Optional[Tuple[tuple, ...]]:
+        """Per-action (name, type_check, required, min_length, max_length, regex) tuples, built once"""
+        spec = self._action_validation_spec.get(action_id)
+        if spec is None:
+            action = self._get_action(action_id)
+            if not action:
+                return None
+            spec = self._action_validation_spec[action_id] = tuple(
+                (
+                    f.name, _TYPE_CHECKERS.get(f.type), f.required, f.min_length, f.max_length,
+                    _compile(f.validation_regex) if f.validation_regex else None
+                )
+                for f in action.inputs
+            )
+        return spec
+    
     def validate_inputs(self, action_id: str, inputs: Dict[str, Any]) -> None:
         """
         Validate inputs against action schema.
         Raises ValidationError if invalid.
         """
-        action = next((a for a in self.get_actions() if a.id == action_id), None)
-        if not action:
+        spec = self._get_validation_spec(action_id)
+        if spec is None:
             raise ValidationError(f"Unknown action: {action_id}")
         
+        field_errors = self._check_fields(spec, inputs)
+        if field_errors:
+            raise ValidationError("Input validation failed", field_errors=field_errors)
+    
+    def validate_inputs_batch(self, action_id: str, inputs_list: List[Dict[str, Any]]) -> None:
+        """
+        Validate many input sets for one action in a single pass.
+        Raises ValidationError with field_errors keyed by item index.
+        """
+        spec = self._get_validation_spec(action_id)
+        if spec is None:
+            raise ValidationError(f"Unknown action: {action_id}")
+        
+        check_fields = self._check_fields
+        errors = {}
+        for index, inputs in enumerate(inputs_list):
+            field_errors = check_fields(spec, inputs)
+            if field_errors:
+                errors[index] = field_errors
+        
+        if errors:
+            raise ValidationError("Input validation failed", field_errors=errors)
+    
+    @staticmethod
+    def _check_fields(spec: Tuple[tuple, ...], inputs: Dict[str, Any]) -> Dict[str, str]:
+        """Return {field name: error} for one input set"""
         field_errors = {}
-        for field in action.inputs:
-            value = inputs.get(field.name)
+        for name, type_check, required, min_length, max_length, regex in spec:
+            value = inputs.get(name)
             
-            # Required check
-            if field.required and value is None:
-                field_errors[field.name] = "This field is required"
+            if value is None:
+                # Required check
+                if required:
+                    field_errors[name] = "This field is required"
                 continue
             
-            if value is not None:
-                # Type validation
-                if field.type == FieldType.INTEGER and not isinstance(value, int):
-                    field_errors[field.name] = "Must be an integer"
-                elif field.type == FieldType.NUMBER and not isinstance(value, (int, float)):
-                    field_errors[field.name] = "Must be a number"
-                elif field.type == FieldType.BOOLEAN and not isinstance(value, bool):
-                    field_errors[field.name] = "Must be a boolean"
-                
-                # Length validation
-                if field.min_length and isinstance(value, str) and len(value) < field.min_length:
-                    field_errors[field.name] = f"Minimum length is {field.min_length}"
-                if field.max_length and isinstance(value, str) and len(value) > field.max_length:
-                    field_errors[field.name] = f"Maximum length is {field.max_length}"
+            # Type validation
+            if type_check and not type_check[0](value):
+                field_errors[name] = type_check[1]
+            
+            # Length validation
+            if min_length and isinstance(value, str) and len(value) < min_length:
+                field_errors[name] = f"Minimum length is {min_length}"
+            if max_length and isinstance(value, str) and len(value) > max_length:
+                field_errors[name] = f"Maximum length is {max_length}"
+            
+            # Format validation; search() like JSON Schema "pattern", which
+            # is unanchored, so this agrees with SchemaRegistry validation
+            if regex and isinstance(value, str) and not regex.search(value):
+                field_errors[name] = "Invalid format"
         
-        if field_errors:
-            raise ValidationError("Input validation failed", field_errors=field_errors)
+        return field_errors
     
     async def close(self):
         """Cleanup resources (HTTP client, etc.)"""
         if self._http_client:
             await self._http_client.aclose()
             self._http_client = None
+    
+    async def __aenter__(self):
+        """Authenticate on entry; resources are released even if that fails"""
+        try:
+            await self.ensure_authenticated()
+        except BaseException:
+            await self.close()
+            raise
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
 
 
 # =============================================================================
 # Declarative Connector (Schema-Driven)
 # =============================================================================
 
+def _elapsed_ms(start_ns: int) -> int:
+    """Milliseconds since a time.monotonic_ns() reading"""
+    return (time.monotonic_ns() - start_ns) // 1_000_000
+
+
+# Methods whose inputs are sent as a JSON body
+_BODY_METHODS = frozenset(("POST", "PUT", "PATCH"))
+
+
+class _PathParams(dict):
+    """format_map mapping that leaves placeholders without an input untouched"""
+    def __missing__(self, key):
+        return "{" + key + "}"
+
+
+def _plain_path_params(endpoint: str) -> Optional[frozenset]:
+    """
+    Names of the {name} placeholders in an endpoint, or None when the endpoint
+    uses anything format_map would treat differently from plain replacement
+    (escaped braces, attributes, indexes, conversions or format specs).
+    """
+    names = set()
+    try:
+        for literal, name, spec, conversion in Formatter().parse(endpoint):
+            if "{" in literal or "}" in literal:
+                return None
+            if name is None:
+                continue
+            if not name.isidentifier() or spec or conversion is not None:
+                return None
+            names.add(name)
+    except ValueError:
+        return None
+    return frozenset(names)
+
+
 class DeclarativeConnector(ConnectorBase):
     """
     Base class for simple REST API connectors defined via schema/manifest.
     Useful for straightforward APIs where a declarative approach suffices.
     """
     
+    # Instances are created per execution, so keep-alive connections live on
+    # one class-wide pool; auth travels in per-request headers and the pool
+    # keeps no cookies, so nothing set for one tenant reaches another
+    _shared_client = None
+    
     def __init__(
         self,
         manifest: Dict[str, Any],
@@ -419,18 +623,42 @@ class DeclarativeConnector(ConnectorBase):
         self.manifest = manifest
         self._parsed_actions: List[ActionDefinition] = []
         self._parsed_triggers: List[TriggerDefinition] = []
+        self._action_runtime: Dict[str, Dict[str, Any]] = {}
+        self._auth_headers_cache: Optional[Dict[str, str]] = None
+        self._auth_headers_sig: Optional[tuple] = None
         self._parse_manifest()
     
+    @classmethod
+    def from_json(cls, raw: bytes, auth_config: Optional[AuthConfig] = None) -> "DeclarativeConnector":
+        """Create a connector from a JSON-encoded manifest"""
+        return cls(_json_loads(raw), auth_config)
+    
     def _parse_manifest(self):
         """Parse the manifest into action/trigger definitions"""
+        base_url = self.manifest.get("base_url", "")
+        
         # Parse actions
         for action_def in self.manifest.get("actions", []):
+            endpoint = action_def.get("endpoint", "")
+            
+            # Request details resolved once, with field lists as sets for O(1) membership
+            self._action_runtime[action_def["id"]] = {
+                "manifest": action_def,
+                "url_prefix": base_url,
+                "endpoint": endpoint,
+                "url": f"{base_url}{endpoint}",
+                "path_params": _plain_path_params(endpoint),
+                "method": str(action_def.get("method", "GET")).upper(),
+                "body_fields": frozenset(action_def.get("body_fields", [])),
+                "query_fields": frozenset(action_def.get("query_fields", [])),
+                "include_raw_response": bool(action_def.get("include_raw_response")),
+            }
             self._parsed_actions.append(ActionDefinition(
                 id=action_def["id"],
                 name=action_def["name"],
                 description=action_def.get("description", ""),
-                inputs=[FieldDefinition(**f) for f in action_def.get("inputs", [])],
-                outputs=[FieldDefinition(**f) for f in action_def.get("outputs", [])],
+                inputs=_FIELD_LIST_ADAPTER.validate_python(action_def.get("inputs", [])),
+                outputs=_FIELD_LIST_ADAPTER.validate_python(action_def.get("outputs", [])),
             ))
         
         # Parse triggers
@@ -440,7 +668,7 @@ class DeclarativeConnector(ConnectorBase):
                 name=trigger_def["name"],
                 description=trigger_def.get("description", ""),
                 trigger_type=TriggerType(trigger_def.get("trigger_type", "polling")),
-                outputs=[FieldDefinition(**f) for f in trigger_def.get("outputs", [])],
+                outputs=_FIELD_LIST_ADAPTER.validate_python(trigger_def.get("outputs", [])),
             ))
     
     @classmethod
@@ -450,8 +678,6 @@ class DeclarativeConnector(ConnectorBase):
     
     async def authenticate(self) -> bool:
         """Default authentication using manifest-defined auth type"""
-        import httpx
-        
         auth_type = self.auth_config.auth_type if self.auth_config else AuthType.NONE
         base_url = self.manifest.get("base_url", "")
         
@@ -460,17 +686,35 @@ class DeclarativeConnector(ConnectorBase):
             test_endpoint = self.manifest.get("test_endpoint")
             if test_endpoint:
                 headers = self._build_auth_headers()
-                async with httpx.AsyncClient() as client:
-                    resp = await client.get(f"{base_url}{test_endpoint}", headers=headers)
-                    if resp.status_code == 401:
-                        raise AuthenticationError("Invalid API key")
-                    resp.raise_for_status()
+                client = await self._get_client()
+                resp = await client.get(f"{base_url}{test_endpoint}", headers=headers)
+                if resp.status_code == 401:
+                    raise AuthenticationError("Invalid API key")
+                resp.raise_for_status()
         
         self._authenticated = True
         return True
     
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client shared by all declarative connectors"""
+        client = DeclarativeConnector._shared_client
+        if client is None or client.is_closed:
+            client = DeclarativeConnector._shared_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                cookies=CookieJar(policy=_NoCookiesPolicy()),
+            )
+        return client
+    
+    @classmethod
+    async def shutdown_all(cls):
+        """Close the shared HTTP client (call on application shutdown)"""
+        client = DeclarativeConnector._shared_client
+        DeclarativeConnector._shared_client = None
+        if client is not None:
+            await client.aclose()
+    
     def _build_auth_headers(self) -> Dict[str, str]:
-        """Build authentication headers based on auth config"""
+        """Build authentication headers based on auth config (cached until it changes)"""
         headers = {}
         if not self.auth_config:
             return headers
@@ -478,19 +722,25 @@ class DeclarativeConnector(ConnectorBase):
         creds = self.auth_config.credentials
         auth_type = self.auth_config.auth_type
         
+        signature = (auth_type, self.auth_config.access_token, tuple(creds.items()))
+        if signature == self._auth_headers_sig:
+            return self._auth_headers_cache.copy()
+        
         if auth_type == AuthType.API_KEY:
-            header_name = self.manifest.get("auth", {}).get("header_name", "X-API-Key")
+            auth = self.manifest.get("auth")
+            header_name = auth.get("header_name", "X-API-Key") if auth else "X-API-Key"
             headers[header_name] = creds.get("api_key", "")
         elif auth_type == AuthType.BEARER:
             token = self.auth_config.access_token or creds.get("token", "")
             headers["Authorization"] = f"Bearer {token}"
         elif auth_type == AuthType.BASIC:
-            import base64
             credentials = f"{creds.get('username', '')}:{creds.get('password', '')}"
             encoded = base64.b64encode(credentials.encode()).decode()
             headers["Authorization"] = f"Basic {encoded}"
         
-        return headers
+        self._auth_headers_sig = signature
+        self._auth_headers_cache = headers
+        return headers.copy()
     
     def get_actions(self) -> List[ActionDefinition]:
         return self._parsed_actions
@@ -505,17 +755,11 @@ class DeclarativeConnector(ConnectorBase):
         context: ExecutionContext
     ) -> ExecutionResult:
         """Execute action based on manifest definition"""
-        import httpx
-        import time
-        
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         
         # Find action definition in manifest
-        action_manifest = next(
-            (a for a in self.manifest.get("actions", []) if a["id"] == action_id),
-            None
-        )
-        if not action_manifest:
+        action = self._action_runtime.get(action_id)
+        if not action:
             return ExecutionResult(
                 success=False,
                 error_message=f"Unknown action: {action_id}",
@@ -525,64 +769,82 @@ class DeclarativeConnector(ConnectorBase):
         await self.ensure_authenticated()
         
         # Build request
-        base_url = self.manifest.get("base_url", "")
-        endpoint = action_manifest.get("endpoint", "")
-        method = action_manifest.get("method", "GET").upper()
+        method = action["method"]
         
-        # Variable substitution in endpoint
-        for key, value in inputs.items():
-            endpoint = endpoint.replace(f"{{{key}}}", str(value))
-        
-        url = f"{base_url}{endpoint}"
+        # Variable substitution in endpoint; static endpoints use the prebuilt URL
+        path_params = action["path_params"]
+        if path_params is None:
+            # Endpoint is not a plain template, substitute inputs literally
+            endpoint = action["endpoint"]
+            for key, value in inputs.items():
+                endpoint = endpoint.replace(f"{{{key}}}", str(value))
+            url = f"{action['url_prefix']}{endpoint}"
+        elif path_params:
+            endpoint = action["endpoint"].format_map(
+                _PathParams({k: str(inputs[k]) for k in path_params if k in inputs})
+            )
+            url = f"{action['url_prefix']}{endpoint}"
+        else:
+            url = action["url"]
         headers = self._build_auth_headers()
-        headers["Content-Type"] = "application/json"
+        if method in _BODY_METHODS:
+            headers["Content-Type"] = "application/json"
         
         # Determine body/params based on method
-        body_fields = action_manifest.get("body_fields", [])
-        query_fields = action_manifest.get("query_fields", [])
+        body_fields = action["body_fields"]
+        query_fields = action["query_fields"]
         
         body = {k: v for k, v in inputs.items() if k in body_fields}
         params = {k: v for k, v in inputs.items() if k in query_fields}
         
         try:
-            async with httpx.AsyncClient(timeout=context.timeout_ms / 1000) as client:
-                if method in ("POST", "PUT", "PATCH"):
-                    resp = await client.request(method, url, headers=headers, json=body, params=params)
-                else:
-                    resp = await client.request(method, url, headers=headers, params=params)
-                
-                execution_time_ms = int((time.time() - start_time) * 1000)
-                
-                # Handle rate limiting
-                if resp.status_code == 429:
-                    retry_after = int(resp.headers.get("Retry-After", 60))
-                    raise RateLimitError(
-                        "Rate limit exceeded",
-                        retry_after=retry_after,
-                        connector_id=self.manifest.get("id")
-                    )
-                
-                resp.raise_for_status()
-                data = resp.json() if resp.content else {}
-                
-                return ExecutionResult(
-                    success=True,
-                    data=data,
-                    execution_time_ms=execution_time_ms,
-                    raw_response=data
+            client = await self._get_client()
+            timeout = context.timeout_ms / 1000
+            if method in _BODY_METHODS:
+                resp = await client.request(method, url, headers=headers, json=body, params=params, timeout=timeout)
+            else:
+                resp = await client.request(method, url, headers=headers, params=params, timeout=timeout)
+            
+            execution_time_ms = _elapsed_ms(start_ns)
+            
+            # Handle rate limiting
+            if resp.status_code == 429:
+                retry_after = int(resp.headers.get("Retry-After", 60))
+                raise RateLimitError(
+                    "Rate limit exceeded",
+                    retry_after=retry_after,
+                    connector_id=self.manifest.get("id")
                 )
-                
+            
+            resp.raise_for_status()
+            content = resp.content
+            try:
+                data = _json_loads(content) if content else {}
+            except ValueError:
+                # Non-JSON body (HTML, plain text); pass it through as text
+                data = {"text": resp.text}
+            if not isinstance(data, dict):
+                # ExecutionResult.data is a dict; wrap top-level arrays/scalars
+                data = {"items": data} if isinstance(data, list) else {"value": data}
+            
+            return ExecutionResult(
+                success=True,
+                data=data,
+                execution_time_ms=execution_time_ms,
+                raw_response=data if action["include_raw_response"] else None
+            )
+            
         except httpx.HTTPStatusError as e:
             return ExecutionResult(
                 success=False,
                 error_message=str(e),
                 error_code=f"HTTP_{e.response.status_code}",
-                execution_time_ms=int((time.time() - start_time) * 1000)
+                execution_time_ms=_elapsed_ms(start_ns)
             )
         except Exception as e:
             return ExecutionResult(
                 success=False,
                 error_message=str(e),
                 error_code="EXECUTION_ERROR",
-                execution_time_ms=int((time.time() - start_time) * 1000)
+                execution_time_ms=_elapsed_ms(start_ns)
             )
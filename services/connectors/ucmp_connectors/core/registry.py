@@ -5,9 +5,18 @@ Central registry for managing connector classes and instances.
 """
 
 from typing import Dict, List, Optional, Type, Any
-from .base import ConnectorBase, ConnectorMetadata, AuthConfig, DeclarativeConnector
+from .base import (
+    ConnectorBase,
+    ConnectorMetadata,
+    ActionDefinition,
+    TriggerDefinition,
+    AuthConfig,
+    DeclarativeConnector,
+    _json_loads,
+)
 import logging
 import importlib
+import inspect
 import pkgutil
 from pathlib import Path
 
@@ -29,6 +38,8 @@ class ConnectorRegistry:
         self._connectors: Dict[str, Type[ConnectorBase]] = {}
         self._manifests: Dict[str, Dict[str, Any]] = {}
         self._metadata_cache: Dict[str, ConnectorMetadata] = {}
+        # category -> connector IDs (dict used as an insertion-ordered set)
+        self._by_category: Dict[str, Dict[str, None]] = {}
     
     @classmethod
     def get_instance(cls) -> "ConnectorRegistry":
@@ -43,14 +54,14 @@ class ConnectorRegistry:
     
     def register(self, connector_class: Type[ConnectorBase]) -> None:
         """Register a code-based connector class"""
-        metadata = connector_class.get_metadata()
+        metadata = connector_class.get_metadata_cached()
         connector_id = metadata.id
         
         if connector_id in self._connectors:
             logger.warning(f"Overwriting existing connector: {connector_id}")
         
         self._connectors[connector_id] = connector_class
-        self._metadata_cache[connector_id] = metadata
+        self._cache_metadata(metadata)
         logger.info(f"Registered connector: {connector_id} ({metadata.name})")
     
     def register_manifest(self, manifest: Dict[str, Any]) -> None:
@@ -65,17 +76,34 @@ class ConnectorRegistry:
         self._manifests[connector_id] = manifest
         
         # Cache metadata
-        self._metadata_cache[connector_id] = self._manifest_to_metadata(manifest)
+        self._cache_metadata(self._manifest_to_metadata(manifest))
         logger.info(f"Registered manifest connector: {connector_id}")
     
+    def _cache_metadata(self, metadata: ConnectorMetadata) -> None:
+        """Store metadata and index the connector under its categories"""
+        self._uncache_metadata(metadata.id)
+        self._metadata_cache[metadata.id] = metadata
+        for category in metadata.categories:
+            self._by_category.setdefault(category, {})[metadata.id] = None
+    
+    def _uncache_metadata(self, connector_id: str) -> None:
+        """Drop cached metadata and its category index entries"""
+        metadata = self._metadata_cache.pop(connector_id, None)
+        if metadata is None:
+            return
+        for category in metadata.categories:
+            ids = self._by_category.get(category)
+            if ids is not None:
+                ids.pop(connector_id, None)
+                if not ids:
+                    del self._by_category[category]
+    
     def _manifest_to_metadata(self, manifest: Dict[str, Any]) -> ConnectorMetadata:
         """Convert manifest to ConnectorMetadata"""
-        from .base import AuthSchemaDefinition, FieldDefinition, AuthType
+        from .base import AuthSchemaDefinition, AuthType, _FIELD_LIST_ADAPTER
         
         auth_config = manifest.get("auth", {})
-        auth_fields = [
-            FieldDefinition(**f) for f in auth_config.get("fields", [])
-        ]
+        auth_fields = _FIELD_LIST_ADAPTER.validate_python(auth_config.get("fields", []))
         
         return ConnectorMetadata(
             id=manifest["id"],
@@ -104,8 +132,7 @@ class ConnectorRegistry:
         if connector_id in self._manifests:
             del self._manifests[connector_id]
             removed = True
-        if connector_id in self._metadata_cache:
-            del self._metadata_cache[connector_id]
+        self._uncache_metadata(connector_id)
         return removed
     
     # -------------------------------------------------------------------------
@@ -149,7 +176,11 @@ class ConnectorRegistry:
     def load_manifests_from_directory(self, directory: str) -> int:
         """Load declarative connector manifests from a directory"""
         import yaml
-        import json
+        try:
+            # libyaml-backed loader; falls back when PyYAML was built without it
+            from yaml import CSafeLoader as YamlLoader
+        except ImportError:
+            from yaml import SafeLoader as YamlLoader
         
         count = 0
         dir_path = Path(directory)
@@ -160,8 +191,8 @@ class ConnectorRegistry:
         
         for file_path in dir_path.glob("**/*.yaml"):
             try:
-                with open(file_path) as f:
-                    manifest = yaml.safe_load(f)
+                with open(file_path, "rb") as f:
+                    manifest = yaml.load(f, Loader=YamlLoader)
                 self.register_manifest(manifest)
                 count += 1
             except Exception as e:
@@ -169,8 +200,8 @@ class ConnectorRegistry:
         
         for file_path in dir_path.glob("**/*.json"):
             try:
-                with open(file_path) as f:
-                    manifest = json.load(f)
+                with open(file_path, "rb") as f:
+                    manifest = _json_loads(f.read())
                 self.register_manifest(manifest)
                 count += 1
             except Exception as e:
@@ -215,6 +246,29 @@ class ConnectorRegistry:
         logger.warning(f"Connector not found: {connector_id}")
         return None
     
+    def get_action_definitions(self, connector_id: str) -> Optional[List[ActionDefinition]]:
+        """
+        Get a connector's actions without creating an instance.
+        Returns None if the connector only exposes actions per instance.
+        """
+        return self._class_level_definitions(connector_id, "get_actions")
+    
+    def get_trigger_definitions(self, connector_id: str) -> Optional[List[TriggerDefinition]]:
+        """
+        Get a connector's triggers without creating an instance.
+        Returns None if the connector only exposes triggers per instance.
+        """
+        return self._class_level_definitions(connector_id, "get_triggers")
+    
+    def _class_level_definitions(self, connector_id: str, method_name: str) -> Optional[list]:
+        """Call get_actions/get_triggers on the class if it is a classmethod"""
+        connector_class = self._connectors.get(connector_id)
+        if connector_class is None:
+            return None
+        if not isinstance(inspect.getattr_static(connector_class, method_name), classmethod):
+            return None
+        return getattr(connector_class, method_name)()
+    
     def has_connector(self, connector_id: str) -> bool:
         """Check if a connector is registered"""
         return connector_id in self._connectors or connector_id in self._manifests
@@ -233,7 +287,16 @@ class ConnectorRegistry:
         """Search connectors by various criteria"""
         results = []
         
-        for metadata in self._metadata_cache.values():
+        # Category filter: narrow the candidates through the index
+        if categories:
+            candidate_ids: Dict[str, None] = {}
+            for category in categories:
+                candidate_ids.update(self._by_category.get(category, {}))
+            candidates = [self._metadata_cache[cid] for cid in candidate_ids]
+        else:
+            candidates = self._metadata_cache.values()
+        
+        for metadata in candidates:
             # Text search
             if query:
                 query_lower = query.lower()
@@ -244,11 +307,6 @@ class ConnectorRegistry:
                 ):
                     continue
             
-            # Category filter
-            if categories:
-                if not any(c in metadata.categories for c in categories):
-                    continue
-            
             # Tag filter
             if tags:
                 if not any(t in metadata.tags for t in tags):
@@ -265,7 +323,7 @@ class ConnectorRegistry:
     
     def get_by_category(self, category: str) -> List[ConnectorMetadata]:
         """Get all connectors in a category"""
-        return [m for m in self._metadata_cache.values() if category in m.categories]
+        return [self._metadata_cache[cid] for cid in self._by_category.get(category, {})]
 
 
 # =============================================================================
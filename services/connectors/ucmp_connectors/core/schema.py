@@ -5,7 +5,8 @@ Manages JSON Schemas for connector actions and triggers.
 Powers dynamic UI generation and validation.
 """
 
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, Iterator, List, Mapping, Optional, Tuple
 from .base import (
     ConnectorBase,
     ActionDefinition,
@@ -15,20 +16,198 @@ from .base import (
     ConnectorMetadata,
 )
 from .registry import ConnectorRegistry
+from collections import OrderedDict
+import copy
+import functools
+import hashlib
+import json
 import logging
+import jsonschema
 
 logger = logging.getLogger(__name__)
 
+# orjson serializes the exports several times faster than json when installed
+try:
+    import orjson
+    
+    def _json_dumps_indented(value: Any) -> str:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode()
+    
+    _json_dumps_bytes = orjson.dumps
+    
+    def _json_dumps_canonical(value: Any) -> bytes:
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+except ImportError:
+    def _json_dumps_indented(value: Any) -> str:
+        return json.dumps(value, indent=2)
+    
+    def _json_dumps_bytes(value: Any) -> bytes:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+    
+    def _json_dumps_canonical(value: Any) -> bytes:
+        return json.dumps(
+            value, ensure_ascii=False, separators=(",", ":"), sort_keys=True
+        ).encode()
+
+# Default entry limit for each SchemaRegistry cache
+DEFAULT_SCHEMA_CACHE_SIZE = 1024
+
+# Module-level field schema memo; keys come from manifest content, so it is
+# bounded too (sized for several fields per cached field set)
+_FIELD_SCHEMA_CACHE_SIZE = 4096
+
+# Property schemas up to this size (canonical JSON bytes) are never
+# deduplicated into shared OpenAPI components
+_MIN_SHARED_SCHEMA_BYTES = 64
+
+
+# =============================================================================
+# Field Schema Conversion
+# =============================================================================
+
+_FIELD_TYPE_SCHEMA: Mapping[FieldType, Dict[str, Any]] = MappingProxyType({
+    FieldType.STRING: {"type": "string"},
+    FieldType.NUMBER: {"type": "number"},
+    FieldType.INTEGER: {"type": "integer"},
+    FieldType.BOOLEAN: {"type": "boolean"},
+    FieldType.ARRAY: {"type": "array"},
+    FieldType.OBJECT: {"type": "object"},
+    FieldType.DATE: {"type": "string", "format": "date"},
+    FieldType.DATETIME: {"type": "string", "format": "date-time"},
+    FieldType.EMAIL: {"type": "string", "format": "email"},
+    FieldType.URL: {"type": "string", "format": "uri"},
+    FieldType.PHONE: {"type": "string", "pattern": r"^\+?[1-9]\d{1,14}$"},
+    FieldType.PASSWORD: {"type": "string", "writeOnly": True},
+    FieldType.TEXT: {"type": "string"},
+    FieldType.SELECT: {"type": "string"},
+    FieldType.MULTISELECT: {"type": "array", "items": {"type": "string"}},
+    FieldType.FILE: {"type": "string", "contentEncoding": "base64"},
+})
+_DEFAULT_STRING: Dict[str, Any] = {"type": "string"}
+
+
+def _field_key(field: FieldDefinition) -> tuple:
+    """Hashable content key for a field's schema"""
+    return (
+        field.type,
+        field.description,
+        field.label,
+        field.default,
+        field.placeholder,
+        field.min_length,
+        field.max_length,
+        field.min_value,
+        field.max_value,
+        field.validation_regex,
+        field.secret,
+        field.depends_on,
+        tuple((opt["value"], opt["label"]) for opt in field.options),
+    )
+
+
+def _build_field_schema(field_key: tuple) -> Dict[str, Any]:
+    """Build the JSON Schema for a field from its content key"""
+    (
+        field_type, description, label, default, placeholder,
+        min_length, max_length, min_value, max_value,
+        validation_regex, secret, depends_on, options,
+    ) = field_key
+    
+    base = _FIELD_TYPE_SCHEMA.get(field_type, _DEFAULT_STRING)
+    schema = {**base}
+    
+    # Add common properties
+    if description:
+        schema["description"] = description
+    if label:
+        schema["title"] = label
+    if default is not None:
+        schema["default"] = default
+    if placeholder:
+        schema["examples"] = [placeholder]
+    
+    # Validation constraints
+    if min_length is not None:
+        schema["minLength"] = min_length
+    if max_length is not None:
+        schema["maxLength"] = max_length
+    if min_value is not None:
+        schema["minimum"] = min_value
+    if max_value is not None:
+        schema["maximum"] = max_value
+    if validation_regex:
+        schema["pattern"] = validation_regex
+    
+    # Enum for SELECT fields
+    if field_type in (FieldType.SELECT, FieldType.MULTISELECT) and options:
+        values = []
+        labels = {}
+        for value, option_label in options:
+            values.append(value)
+            labels[value] = option_label
+        schema["enum"] = values
+        # Store labels in custom property for UI
+        schema["x-enum-labels"] = labels
+    
+    # Custom UI hints
+    ui_hints = {}
+    if secret:
+        ui_hints["secret"] = True
+    if depends_on:
+        ui_hints["depends_on"] = depends_on
+    if field_type == FieldType.TEXT:
+        ui_hints["multiline"] = True
+    
+    if ui_hints:
+        schema["x-ui-hints"] = ui_hints
+    
+    return schema
+
+
+# Same field content always yields the same schema; callers get a copy
+_field_schema_cached = functools.lru_cache(maxsize=_FIELD_SCHEMA_CACHE_SIZE)(_build_field_schema)
+
+
+def _build_properties(fields_key: tuple) -> tuple:
+    """Build (properties, required) for a set of (name, required, field_key)"""
+    properties = {
+        name: _build_field_schema(field_key)
+        for name, _, field_key in fields_key
+    }
+    required = [name for name, is_required, _ in fields_key if is_required]
+    return properties, required
+
+
+# Keyed on field content, not id(): declarative connectors parse fresh
+# FieldDefinition objects per instance, so ids would never repeat
+_properties_cached = functools.lru_cache(maxsize=DEFAULT_SCHEMA_CACHE_SIZE)(_build_properties)
+
 
 class SchemaRegistry:
     """
     Generates and caches JSON Schemas for connector actions/triggers.
     Used by frontend to dynamically render input forms.
+    
+    Returned schemas share nested dicts with the caches and must be
+    treated as read-only; field_to_json_schema returns a fresh copy.
     """
     
-    def __init__(self, connector_registry: ConnectorRegistry = None):
+    def __init__(
+        self,
+        connector_registry: ConnectorRegistry = None,
+        max_cache_size: int = DEFAULT_SCHEMA_CACHE_SIZE
+    ):
         self.connector_registry = connector_registry or ConnectorRegistry.get_instance()
-        self._schema_cache: Dict[str, Dict[str, Any]] = {}
+        # LRU caches, bounded by max_cache_size entries each
+        self._max_cache_size = max_cache_size
+        self._schema_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # Compact JSON bytes of cached schemas, for responses that only serialize
+        self._schema_json_cache: "OrderedDict[str, bytes]" = OrderedDict()
+        # Compiled Draft7Validator per "connector_id:action_id"
+        self._validator_cache: "OrderedDict[str, jsonschema.Draft7Validator]" = OrderedDict()
+        # Action/trigger definitions by id, per connector_id
+        self._action_index_cache: Dict[str, Dict[str, ActionDefinition]] = {}
+        self._trigger_index_cache: Dict[str, Dict[str, TriggerDefinition]] = {}
     
     # -------------------------------------------------------------------------
     # Schema Generation
@@ -36,68 +215,27 @@ class SchemaRegistry:
     
     def field_to_json_schema(self, field: FieldDefinition) -> Dict[str, Any]:
         """Convert a FieldDefinition to JSON Schema"""
-        type_mapping = {
-            FieldType.STRING: {"type": "string"},
-            FieldType.NUMBER: {"type": "number"},
-            FieldType.INTEGER: {"type": "integer"},
-            FieldType.BOOLEAN: {"type": "boolean"},
-            FieldType.ARRAY: {"type": "array"},
-            FieldType.OBJECT: {"type": "object"},
-            FieldType.DATE: {"type": "string", "format": "date"},
-            FieldType.DATETIME: {"type": "string", "format": "date-time"},
-            FieldType.EMAIL: {"type": "string", "format": "email"},
-            FieldType.URL: {"type": "string", "format": "uri"},
-            FieldType.PHONE: {"type": "string", "pattern": r"^\+?[1-9]\d{1,14}$"},
-            FieldType.PASSWORD: {"type": "string", "writeOnly": True},
-            FieldType.TEXT: {"type": "string"},
-            FieldType.SELECT: {"type": "string"},
-            FieldType.MULTISELECT: {"type": "array", "items": {"type": "string"}},
-            FieldType.FILE: {"type": "string", "contentEncoding": "base64"},
-        }
-        
-        schema = type_mapping.get(field.type, {"type": "string"}).copy()
-        
-        # Add common properties
-        if field.description:
-            schema["description"] = field.description
-        if field.label:
-            schema["title"] = field.label
-        if field.default is not None:
-            schema["default"] = field.default
-        if field.placeholder:
-            schema["examples"] = [field.placeholder]
-        
-        # Validation constraints
-        if field.min_length is not None:
-            schema["minLength"] = field.min_length
-        if field.max_length is not None:
-            schema["maxLength"] = field.max_length
-        if field.min_value is not None:
-            schema["minimum"] = field.min_value
-        if field.max_value is not None:
-            schema["maximum"] = field.max_value
-        if field.validation_regex:
-            schema["pattern"] = field.validation_regex
-        
-        # Enum for SELECT fields
-        if field.type in (FieldType.SELECT, FieldType.MULTISELECT) and field.options:
-            schema["enum"] = [opt["value"] for opt in field.options]
-            # Store labels in custom property for UI
-            schema["x-enum-labels"] = {opt["value"]: opt["label"] for opt in field.options}
-        
-        # Custom UI hints
-        ui_hints = {}
-        if field.secret:
-            ui_hints["secret"] = True
-        if field.depends_on:
-            ui_hints["depends_on"] = field.depends_on
-        if field.type == FieldType.TEXT:
-            ui_hints["multiline"] = True
-        
-        if ui_hints:
-            schema["x-ui-hints"] = ui_hints
-        
-        return schema
+        field_key = _field_key(field)
+        try:
+            schema = _field_schema_cached(field_key)
+        except TypeError:
+            # Unhashable default (list/dict) - build without the cache
+            schema = _build_field_schema(field_key)
+        return copy.deepcopy(schema)
+    
+    def _fields_to_properties(
+        self,
+        fields: List[FieldDefinition]
+    ) -> tuple[Dict[str, Any], List[str]]:
+        """
+        JSON Schema properties and required names for a list of fields.
+        The cached containers are returned as-is; schemas are read-only.
+        """
+        fields_key = tuple((f.name, f.required, _field_key(f)) for f in fields)
+        try:
+            return _properties_cached(fields_key)
+        except TypeError:
+            return _build_properties(fields_key)
     
     def action_to_json_schema(
         self,
@@ -105,11 +243,7 @@ class SchemaRegistry:
         action: ActionDefinition
     ) -> Dict[str, Any]:
         """Generate JSON Schema for an action's inputs"""
-        required_fields = [f.name for f in action.inputs if f.required]
-        
-        properties = {}
-        for field in action.inputs:
-            properties[field.name] = self.field_to_json_schema(field)
+        properties, required_fields = self._fields_to_properties(action.inputs)
         
         schema = {
             "$schema": "http://json-schema.org/draft-07/schema#",
@@ -124,9 +258,7 @@ class SchemaRegistry:
         
         # Add output schema reference
         if action.outputs:
-            output_properties = {}
-            for field in action.outputs:
-                output_properties[field.name] = self.field_to_json_schema(field)
+            output_properties, _ = self._fields_to_properties(action.outputs)
             
             schema["x-output-schema"] = {
                 "type": "object",
@@ -142,15 +274,12 @@ class SchemaRegistry:
     ) -> Dict[str, Any]:
         """Generate JSON Schema for a trigger's configuration and outputs"""
         # Config schema (what the user configures)
-        config_required = [f.name for f in trigger.config_fields if f.required]
-        config_properties = {}
-        for field in trigger.config_fields:
-            config_properties[field.name] = self.field_to_json_schema(field)
+        config_properties, config_required = self._fields_to_properties(
+            trigger.config_fields
+        )
         
         # Output schema (what the trigger emits)
-        output_properties = {}
-        for field in trigger.outputs:
-            output_properties[field.name] = self.field_to_json_schema(field)
+        output_properties, _ = self._fields_to_properties(trigger.outputs)
         
         return {
             "$schema": "http://json-schema.org/draft-07/schema#",
@@ -182,11 +311,7 @@ class SchemaRegistry:
     def auth_to_json_schema(self, metadata: ConnectorMetadata) -> Dict[str, Any]:
         """Generate JSON Schema for connector authentication"""
         auth_schema = metadata.auth_schema
-        required_fields = [f.name for f in auth_schema.fields if f.required]
-        
-        properties = {}
-        for field in auth_schema.fields:
-            properties[field.name] = self.field_to_json_schema(field)
+        properties, required_fields = self._fields_to_properties(auth_schema.fields)
         
         schema = {
             "$schema": "http://json-schema.org/draft-07/schema#",
@@ -212,55 +337,80 @@ class SchemaRegistry:
         self,
         connector_id: str,
         action_id: str,
-        use_cache: bool = True
+        use_cache: bool = True,
+        connectors: Optional[Dict[str, Optional[ConnectorBase]]] = None
     ) -> Optional[Dict[str, Any]]:
         """Get JSON Schema for a specific action"""
         cache_key = f"{connector_id}:action:{action_id}"
         
-        if use_cache and cache_key in self._schema_cache:
-            return self._schema_cache[cache_key]
-        
-        # Get connector and action
-        connector = self.connector_registry.create_instance(connector_id)
-        if not connector:
-            return None
-        
-        action = next(
-            (a for a in connector.get_actions() if a.id == action_id),
-            None
-        )
+        if use_cache:
+            cached = self._lru_get(self._schema_cache, cache_key)
+            if cached is not None:
+                return cached
+        
+        # Get action definition; an uncached lookup re-reads the definitions
+        actions = self._action_index_cache.get(connector_id) if use_cache else None
+        if actions is None:
+            definitions = self._get_definitions(connector_id, connectors)
+            if not definitions:
+                return None
+            actions = {a.id: a for a in definitions[0]}
+            self._action_index_cache[connector_id] = actions
+        action = actions.get(action_id)
         if not action:
             return None
         
         schema = self.action_to_json_schema(connector_id, action)
-        self._schema_cache[cache_key] = schema
+        self._lru_put(self._schema_cache, cache_key, schema)
+        # Drop entries derived from the previous schema
+        self._schema_json_cache.pop(cache_key, None)
+        self._validator_cache.pop(f"{connector_id}:{action_id}", None)
         return schema
     
+    def get_action_schema_json(
+        self,
+        connector_id: str,
+        action_id: str
+    ) -> Optional[bytes]:
+        """Get the action schema pre-serialized as compact JSON bytes"""
+        cache_key = f"{connector_id}:action:{action_id}"
+        data = self._lru_get(self._schema_json_cache, cache_key)
+        if data is None:
+            schema = self.get_action_schema(connector_id, action_id)
+            if not schema:
+                return None
+            data = _json_dumps_bytes(schema)
+            self._lru_put(self._schema_json_cache, cache_key, data)
+        return data
+    
     def get_trigger_schema(
         self,
         connector_id: str,
         trigger_id: str,
-        use_cache: bool = True
+        use_cache: bool = True,
+        connectors: Optional[Dict[str, Optional[ConnectorBase]]] = None
     ) -> Optional[Dict[str, Any]]:
         """Get JSON Schema for a specific trigger"""
         cache_key = f"{connector_id}:trigger:{trigger_id}"
         
-        if use_cache and cache_key in self._schema_cache:
-            return self._schema_cache[cache_key]
-        
-        connector = self.connector_registry.create_instance(connector_id)
-        if not connector:
-            return None
-        
-        trigger = next(
-            (t for t in connector.get_triggers() if t.id == trigger_id),
-            None
-        )
+        if use_cache:
+            cached = self._lru_get(self._schema_cache, cache_key)
+            if cached is not None:
+                return cached
+        
+        triggers = self._trigger_index_cache.get(connector_id) if use_cache else None
+        if triggers is None:
+            definitions = self._get_definitions(connector_id, connectors)
+            if not definitions:
+                return None
+            triggers = {t.id: t for t in definitions[1]}
+            self._trigger_index_cache[connector_id] = triggers
+        trigger = triggers.get(trigger_id)
         if not trigger:
             return None
         
         schema = self.trigger_to_json_schema(connector_id, trigger)
-        self._schema_cache[cache_key] = schema
+        self._lru_put(self._schema_cache, cache_key, schema)
         return schema
     
     def get_auth_schema(
@@ -271,17 +421,46 @@ class SchemaRegistry:
         """Get JSON Schema for connector authentication"""
         cache_key = f"{connector_id}:auth"
         
-        if use_cache and cache_key in self._schema_cache:
-            return self._schema_cache[cache_key]
+        if use_cache:
+            cached = self._lru_get(self._schema_cache, cache_key)
+            if cached is not None:
+                return cached
         
         metadata = self.connector_registry.get_metadata(connector_id)
         if not metadata:
             return None
         
         schema = self.auth_to_json_schema(metadata)
-        self._schema_cache[cache_key] = schema
+        self._lru_put(self._schema_cache, cache_key, schema)
         return schema
     
+    def warm_cache(self, connector_id: str = None) -> int:
+        """
+        Build and cache auth/action/trigger schemas up front
+        (optionally for a specific connector). Returns schemas cached.
+        """
+        connector_ids = (
+            [connector_id] if connector_id
+            else self.connector_registry.get_connector_ids()
+        )
+        connectors: Dict[str, Optional[ConnectorBase]] = {}
+        count = 0
+        for cid in connector_ids:
+            if not self.get_auth_schema(cid):
+                continue
+            count += 1
+            definitions = self._get_definitions(cid, connectors)
+            if not definitions:
+                continue
+            actions, triggers = definitions
+            for action in actions:
+                if self.get_action_schema(cid, action.id, connectors=connectors):
+                    count += 1
+            for trigger in triggers:
+                if self.get_trigger_schema(cid, trigger.id, connectors=connectors):
+                    count += 1
+        return count
+    
     def get_connector_schemas(
         self,
         connector_id: str
@@ -291,10 +470,75 @@ class SchemaRegistry:
         if not metadata:
             return None
         
-        connector = self.connector_registry.create_instance(connector_id)
-        if not connector:
+        definitions = self._get_definitions(connector_id)
+        if not definitions:
             return None
         
+        return self._build_connector_schemas(connector_id, metadata, *definitions)
+    
+    def get_all_schemas(self) -> Dict[str, Dict[str, Any]]:
+        """Get schemas for all registered connectors"""
+        return dict(self.iter_connector_schemas())
+    
+    def iter_connector_schemas(self) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """Yield (connector_id, schemas) one connector at a time"""
+        # One metadata lookup and at most one instance per connector
+        connectors: Dict[str, Optional[ConnectorBase]] = {}
+        for connector_id in self.connector_registry.get_connector_ids():
+            metadata = self.connector_registry.get_metadata(connector_id)
+            definitions = (
+                self._get_definitions(connector_id, connectors)
+                if metadata else None
+            )
+            yield connector_id, (
+                self._build_connector_schemas(connector_id, metadata, *definitions)
+                if definitions else None
+            )
+    
+    def _get_or_create_connector(
+        self,
+        connector_id: str,
+        cache: Optional[Dict[str, Optional[ConnectorBase]]] = None
+    ) -> Optional[ConnectorBase]:
+        """Create a connector instance, reusing one from cache if given"""
+        if cache is not None and connector_id in cache:
+            return cache[connector_id]
+        
+        connector = self.connector_registry.create_instance(connector_id)
+        if cache is not None:
+            cache[connector_id] = connector
+        return connector
+    
+    def _get_definitions(
+        self,
+        connector_id: str,
+        connectors: Optional[Dict[str, Optional[ConnectorBase]]] = None
+    ) -> Optional[Tuple[List[ActionDefinition], List[TriggerDefinition]]]:
+        """
+        Get (actions, triggers) for a connector.
+        Uses the class-level lists when available and only creates an
+        instance for connectors that expose them per instance.
+        """
+        actions = self.connector_registry.get_action_definitions(connector_id)
+        triggers = self.connector_registry.get_trigger_definitions(connector_id)
+        if actions is None or triggers is None:
+            connector = self._get_or_create_connector(connector_id, connectors)
+            if not connector:
+                return None
+            if actions is None:
+                actions = connector.get_actions()
+            if triggers is None:
+                triggers = connector.get_triggers()
+        return actions, triggers
+    
+    def _build_connector_schemas(
+        self,
+        connector_id: str,
+        metadata: ConnectorMetadata,
+        actions: List[ActionDefinition],
+        triggers: List[TriggerDefinition]
+    ) -> Dict[str, Any]:
+        """Assemble the auth/action/trigger schemas for one connector"""
         return {
             "connector_id": connector_id,
             "name": metadata.name,
@@ -303,21 +547,14 @@ class SchemaRegistry:
             "auth": self.auth_to_json_schema(metadata),
             "actions": {
                 action.id: self.action_to_json_schema(connector_id, action)
-                for action in connector.get_actions()
+                for action in actions
             },
             "triggers": {
                 trigger.id: self.trigger_to_json_schema(connector_id, trigger)
-                for trigger in connector.get_triggers()
+                for trigger in triggers
             }
         }
     
-    def get_all_schemas(self) -> Dict[str, Dict[str, Any]]:
-        """Get schemas for all registered connectors"""
-        return {
-            connector_id: self.get_connector_schemas(connector_id)
-            for connector_id in self.connector_registry.get_connector_ids()
-        }
-    
     # -------------------------------------------------------------------------
     # Schema Validation
     # -------------------------------------------------------------------------
@@ -332,48 +569,122 @@ class SchemaRegistry:
         Validate input data against action schema.
         Returns (is_valid, list of error messages).
         """
-        import jsonschema
-        
         schema = self.get_action_schema(connector_id, action_id)
         if not schema:
             return False, [f"Schema not found for {connector_id}/{action_id}"]
         
-        try:
-            jsonschema.validate(data, schema)
-            return True, []
-        except jsonschema.ValidationError as e:
-            return False, [e.message]
-        except jsonschema.SchemaError as e:
-            return False, [f"Invalid schema: {e.message}"]
+        # Check the schema and build the validator once per action
+        cache_key = f"{connector_id}:{action_id}"
+        validator = self._lru_get(self._validator_cache, cache_key)
+        if validator is None:
+            try:
+                jsonschema.Draft7Validator.check_schema(schema)
+            except jsonschema.SchemaError as e:
+                return False, [f"Invalid schema: {e.message}"]
+            validator = jsonschema.Draft7Validator(schema)
+            self._lru_put(self._validator_cache, cache_key, validator)
+        
+        errors = [e.message for e in validator.iter_errors(data)]
+        return not errors, errors
+    
+    def _lru_get(self, cache: OrderedDict, key: str) -> Any:
+        """Return a cached entry (or None), marking it most recently used"""
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+    
+    def _lru_put(self, cache: OrderedDict, key: str, value: Any) -> None:
+        """Store an entry, evicting the least recently used past the limit"""
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self._max_cache_size:
+            cache.popitem(last=False)
     
     def clear_cache(self, connector_id: str = None):
         """Clear schema cache (optionally for a specific connector)"""
+        keyed_caches = (self._schema_cache, self._schema_json_cache, self._validator_cache)
         if connector_id:
-            keys_to_remove = [
-                k for k in self._schema_cache 
-                if k.startswith(f"{connector_id}:")
-            ]
-            for key in keys_to_remove:
-                del self._schema_cache[key]
+            prefix = f"{connector_id}:"
+            for cache in keyed_caches:
+                for key in [k for k in cache if k.startswith(prefix)]:
+                    del cache[key]
+            self._action_index_cache.pop(connector_id, None)
+            self._trigger_index_cache.pop(connector_id, None)
         else:
-            self._schema_cache.clear()
-
+            for cache in keyed_caches:
+                cache.clear()
+            self._action_index_cache.clear()
+            self._trigger_index_cache.clear()
 
 # =============================================================================
 # Schema Export Utilities
 # =============================================================================
 
+def _write_json_member(f, key: str, value: Any, depth: int, first: bool):
+    """Write one "key": value member of an indent=2 JSON object"""
+    pad = "  " * depth
+    # JSON strings never contain raw newlines, so re-indenting is safe
+    body = _json_dumps_indented(value).replace("\n", "\n" + pad)
+    f.write(f"{'' if first else ','}\n{pad}{json.dumps(key)}: {body}")
+
+
+def _write_json_object(f, items: Iterable[Tuple[str, Any]], depth: int = 0) -> int:
+    """Stream (key, value) pairs as an indent=2 JSON object; returns member count"""
+    count = 0
+    f.write("{")
+    for key, value in items:
+        _write_json_member(f, key, value, depth + 1, first=not count)
+        count += 1
+    f.write(f"\n{'  ' * depth}}}" if count else "}")
+    return count
+
+
+def _dedupe_properties(
+    schema: Dict[str, Any],
+    seen: Dict[str, Optional[str]]
+) -> Tuple[Dict[str, Any], List[Tuple[str, Dict[str, Any]]]]:
+    """
+    Replace property schemas already seen elsewhere with $refs to shared
+    "Common..." components. Returns the rewritten schema (the input is not
+    mutated) and any newly created (name, schema) components.
+    """
+    properties = schema.get("properties")
+    if not properties:
+        return schema, []
+    
+    new_components = []
+    rewritten = {}
+    for name, sub_schema in properties.items():
+        canonical = _json_dumps_canonical(sub_schema)
+        # Small schemas are cheaper inline than as a $ref
+        if len(canonical) <= _MIN_SHARED_SCHEMA_BYTES:
+            rewritten[name] = sub_schema
+            continue
+        digest = hashlib.blake2b(canonical, digest_size=8).hexdigest()
+        if digest not in seen:
+            # First occurrence stays inline
+            seen[digest] = None
+            rewritten[name] = sub_schema
+            continue
+        component_name = seen[digest]
+        if component_name is None:
+            component_name = seen[digest] = f"Common{digest}"
+            new_components.append((component_name, sub_schema))
+        rewritten[name] = {"$ref": f"#/components/schemas/{component_name}"}
+    
+    return {**schema, "properties": rewritten}, new_components
+
+
 def export_schemas_to_json(output_path: str, registry: SchemaRegistry = None):
     """Export all connector schemas to a JSON file"""
-    import json
-    
     registry = registry or SchemaRegistry()
-    schemas = registry.get_all_schemas()
     
-    with open(output_path, 'w') as f:
-        json.dump(schemas, f, indent=2)
+    # Serialize one connector at a time instead of the whole registry
+    with open(output_path, 'w', encoding='utf-8') as f:
+        count = _write_json_object(f, registry.iter_connector_schemas())
     
-    logger.info(f"Exported {len(schemas)} connector schemas to {output_path}")
+    logger.info(f"Exported {count} connector schemas to {output_path}")
 
 
 def export_schemas_to_openapi(
@@ -382,67 +693,76 @@ def export_schemas_to_openapi(
     api_version: str = "1.0.0"
 ):
     """Export connector schemas as OpenAPI 3.0 spec"""
-    import json
-    
     registry = registry or SchemaRegistry()
-    all_schemas = registry.get_all_schemas()
-    
-    # Build OpenAPI spec
-    openapi_spec = {
-        "openapi": "3.0.3",
-        "info": {
-            "title": "UCMP Connector API",
-            "version": api_version,
-            "description": "Auto-generated API specification for UCMP connectors"
-        },
-        "paths": {},
-        "components": {
-            "schemas": {}
-        }
+    
+    info = {
+        "title": "UCMP Connector API",
+        "version": api_version,
+        "description": "Auto-generated API specification for UCMP connectors"
     }
+    paths: Dict[str, Any] = {}
+    # Property schema digest -> shared component name (None until repeated)
+    seen: Dict[str, Optional[str]] = {}
     
-    for connector_id, connector_schemas in all_schemas.items():
-        if not connector_schemas:
-            continue
-        
-        # Add auth schema
-        auth_schema_name = f"{connector_id.title()}Auth"
-        openapi_spec["components"]["schemas"][auth_schema_name] = connector_schemas["auth"]
-        
-        # Add action schemas and paths
-        for action_id, action_schema in connector_schemas.get("actions", {}).items():
-            schema_name = f"{connector_id.title()}{action_id.title()}Input"
-            openapi_spec["components"]["schemas"][schema_name] = action_schema
+    def component_schemas() -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield component schemas per connector, collecting paths on the way"""
+        for connector_id, connector_schemas in registry.iter_connector_schemas():
+            if not connector_schemas:
+                continue
             
-            # Create path
-            path = f"/connectors/{connector_id}/actions/{action_id}/execute"
-            openapi_spec["paths"][path] = {
-                "post": {
-                    "summary": action_schema.get("title", action_id),
-                    "description": action_schema.get("description", ""),
-                    "operationId": f"{connector_id}_{action_id}",
-                    "requestBody": {
-                        "required": True,
-                        "content": {
-                            "application/json": {
-                                "schema": {"$ref": f"#/components/schemas/{schema_name}"}
-                            }
-                        }
-                    },
-                    "responses": {
-                        "200": {
-                            "description": "Action executed successfully",
+            # Per-connector name parts, computed once
+            name_prefix = connector_id.title()
+            path_prefix = f"/connectors/{connector_id}/actions/"
+            
+            # Add auth schema
+            auth_schema, shared = _dedupe_properties(connector_schemas["auth"], seen)
+            yield from shared
+            yield f"{name_prefix}Auth", auth_schema
+            
+            # Add action schemas and paths
+            for action_id, action_schema in connector_schemas.get("actions", {}).items():
+                schema_name = f"{name_prefix}{action_id.title()}Input"
+                component, shared = _dedupe_properties(action_schema, seen)
+                yield from shared
+                yield schema_name, component
+                
+                # Create path
+                path = f"{path_prefix}{action_id}/execute"
+                paths[path] = {
+                    "post": {
+                        "summary": action_schema.get("title", action_id),
+                        "description": action_schema.get("description", ""),
+                        "operationId": f"{connector_id}_{action_id}",
+                        "requestBody": {
+                            "required": True,
                             "content": {
                                 "application/json": {
-                                    "schema": action_schema.get("x-output-schema", {"type": "object"})
+                                    "schema": {"$ref": f"#/components/schemas/{schema_name}"}
+                                }
+                            }
+                        },
+                        "responses": {
+                            "200": {
+                                "description": "Action executed successfully",
+                                "content": {
+                                    "application/json": {
+                                        "schema": action_schema.get("x-output-schema", {"type": "object"})
+                                    }
                                 }
                             }
                         }
                     }
                 }
-            }
     
-    with open(output_path, 'w') as f:
-        json.dump(openapi_spec, f, indent=2)
+    # Components are streamed first; paths are small and written after
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write("{")
+        _write_json_member(f, "openapi", "3.0.3", 1, first=True)
+        _write_json_member(f, "info", info, 1, first=False)
+        f.write(',\n  "components": {\n    "schemas": ')
+        _write_json_object(f, component_schemas(), depth=2)
+        f.write("\n  }")
+        _write_json_member(f, "paths", paths, 1, first=False)
+        f.write("\n}")
     
     logger.info(f"Exported OpenAPI spec to {output_path}")
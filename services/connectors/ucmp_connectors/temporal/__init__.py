@@ -10,16 +10,41 @@ from datetime import timedelta
 from temporalio import activity, workflow
 from temporalio.common import RetryPolicy
 
+# Resolved once at import instead of inside every activity call; passed
+# through the workflow sandbox since the workflows below share this module.
+with workflow.unsafe.imports_passed_through():
+    from ..core import ConnectorRegistry, CredentialManager, ExecutionContext
+    from ..core.credentials import InMemoryCredentialBackend
+
 import logging
+import re
+import threading
 
 logger = logging.getLogger(__name__)
 
+# {{step_name.field}} references in multi-step workflow inputs
+_REFERENCE_RE = re.compile(r"\{\{(\w+)\.(\w+)\}\}")
+
+# Fallback credential manager shared by all activities, built on first use
+_DEFAULT_CRED_MANAGER: Optional[CredentialManager] = None
+_DEFAULT_CRED_MANAGER_LOCK = threading.Lock()
+
+
+def _get_default_cred_manager() -> CredentialManager:
+    """Return the shared in-memory CredentialManager, creating it once"""
+    global _DEFAULT_CRED_MANAGER
+    if _DEFAULT_CRED_MANAGER is None:
+        with _DEFAULT_CRED_MANAGER_LOCK:
+            if _DEFAULT_CRED_MANAGER is None:
+                _DEFAULT_CRED_MANAGER = CredentialManager(InMemoryCredentialBackend())
+    return _DEFAULT_CRED_MANAGER
+
 
 # =============================================================================
 # Activity Input/Output Models
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ConnectorActionInput:
     """Input for execute_connector_action activity"""
     connector_id: str
@@ -39,7 +64,7 @@ class ConnectorActionInput:
     retry_on_failure: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectorActionOutput:
     """Output from execute_connector_action activity"""
     success: bool
@@ -53,7 +78,7 @@ class ConnectorActionOutput:
     cursor: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TestConnectionInput:
     """Input for test_connection activity"""
     connector_id: str
@@ -61,7 +86,7 @@ class TestConnectionInput:
     tenant_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TestConnectionOutput:
     """Output from test_connection activity"""
     success: bool
@@ -69,7 +94,7 @@ class TestConnectionOutput:
     details: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PollTriggerInput:
     """Input for poll_trigger activity"""
     connector_id: str
@@ -80,7 +105,7 @@ class PollTriggerInput:
     tenant_id: Optional[str] = None
 
 
-@dataclass 
+@dataclass(slots=True)
 class PollTriggerOutput:
     """Output from poll_trigger activity"""
     events: List[Dict[str, Any]]
@@ -103,23 +128,13 @@ async def execute_connector_action(params: ConnectorActionInput) -> ConnectorAct
     3. Executes the specified action
     4. Returns the result
     """
-    from ..core import (
-        ConnectorRegistry,
-        CredentialManager,
-        ExecutionContext,
-    )
-    from ..core.credentials import InMemoryCredentialBackend
-    
     # Get instances (in production, these would be injected/configured)
     registry = ConnectorRegistry.get_instance()
     
     # TODO: In production, inject the actual credential manager
     # For now, we'll assume credentials are passed or use a shared instance
-    cred_manager = activity.info().get("credential_manager")
-    if not cred_manager:
-        # Fallback for demo - in production this should be properly configured
-        backend = InMemoryCredentialBackend()
-        cred_manager = CredentialManager(backend)
+    # Fallback for demo - in production this should be properly configured
+    cred_manager = activity.info().get("credential_manager") or _get_default_cred_manager()
     
     try:
         # Get auth config from credentials
@@ -186,16 +201,10 @@ async def execute_connector_action(params: ConnectorActionInput) -> ConnectorAct
 @activity.defn
 async def test_connector_connection(params: TestConnectionInput) -> TestConnectionOutput:
     """Test connection with a connector's credentials"""
-    from ..core import ConnectorRegistry, CredentialManager
-    from ..core.credentials import InMemoryCredentialBackend
-    
     registry = ConnectorRegistry.get_instance()
     
     # Get credential manager (same note as above about injection)
-    cred_manager = activity.info().get("credential_manager")
-    if not cred_manager:
-        backend = InMemoryCredentialBackend()
-        cred_manager = CredentialManager(backend)
+    cred_manager = activity.info().get("credential_manager") or _get_default_cred_manager()
     
     try:
         auth_config = await cred_manager.get_auth_config(params.credential_id)
@@ -231,15 +240,9 @@ async def test_connector_connection(params: TestConnectionInput) -> TestConnecti
 @activity.defn
 async def poll_connector_trigger(params: PollTriggerInput) -> PollTriggerOutput:
     """Poll a trigger for new events"""
-    from ..core import ConnectorRegistry, CredentialManager
-    from ..core.credentials import InMemoryCredentialBackend
-    
     registry = ConnectorRegistry.get_instance()
     
-    cred_manager = activity.info().get("credential_manager")
-    if not cred_manager:
-        backend = InMemoryCredentialBackend()
-        cred_manager = CredentialManager(backend)
+    cred_manager = activity.info().get("credential_manager") or _get_default_cred_manager()
     
     try:
         auth_config = await cred_manager.get_auth_config(params.credential_id)
@@ -273,15 +276,9 @@ async def poll_connector_trigger(params: PollTriggerInput) -> PollTriggerOutput:
 @activity.defn
 async def refresh_oauth_token(connector_id: str, credential_id: str) -> bool:
     """Refresh an OAuth2 token"""
-    from ..core import ConnectorRegistry, CredentialManager
-    from ..core.credentials import InMemoryCredentialBackend
-    
     registry = ConnectorRegistry.get_instance()
     
-    cred_manager = activity.info().get("credential_manager")
-    if not cred_manager:
-        backend = InMemoryCredentialBackend()
-        cred_manager = CredentialManager(backend)
+    cred_manager = activity.info().get("credential_manager") or _get_default_cred_manager()
     
     try:
         auth_config = await cred_manager.get_auth_config(credential_id)
@@ -458,21 +455,18 @@ class MultiStepConnectorWorkflow:
         context: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Resolve {{step_name.field}} references in inputs"""
-        import re
+        def replace(match: "re.Match") -> str:
+            step_name, field = match.groups()
+            if step_name in context and field in context[step_name]:
+                return str(context[step_name][field])
+            return match.group(0)
         
         resolved = {}
-        pattern = r"\{\{(\w+)\.(\w+)\}\}"
-        
         for key, value in inputs.items():
-            if isinstance(value, str):
-                matches = re.findall(pattern, value)
-                for step_name, field in matches:
-                    if step_name in context and field in context[step_name]:
-                        replacement = str(context[step_name][field])
-                        value = value.replace(f"{{{{{step_name}.{field}}}}}", replacement)
-                resolved[key] = value
-            else:
-                resolved[key] = value
+            # Literal strings (the common case) skip the regex entirely
+            if isinstance(value, str) and "{{" in value:
+                value = _REFERENCE_RE.sub(replace, value)
+            resolved[key] = value
         
         return resolved
 
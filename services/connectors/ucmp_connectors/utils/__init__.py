@@ -5,13 +5,13 @@ Common utilities for connector development and operation.
 """
 
 import asyncio
-import hashlib
 import hmac
+import itertools
 import time
 import logging
-from typing import Dict, Any, Optional, Callable, TypeVar, List
+from typing import Dict, Any, Optional, Callable, TypeVar, List, Deque, Union
+from collections import deque
 from functools import wraps
-from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
@@ -42,22 +42,24 @@ class RateLimiter:
         self.burst_size = burst_size or int(requests_per_second * 2)
         self.tokens = self.burst_size
         self.last_update = time.monotonic()
-        self._lock = asyncio.Lock()
     
     async def acquire(self):
         """Acquire a token, waiting if necessary"""
-        async with self._lock:
-            now = time.monotonic()
-            elapsed = now - self.last_update
-            self.tokens = min(self.burst_size, self.tokens + elapsed * self.rate)
-            self.last_update = now
-            
-            if self.tokens < 1:
-                wait_time = (1 - self.tokens) / self.rate
-                await asyncio.sleep(wait_time)
-                self.tokens = 0
-            else:
-                self.tokens -= 1
+        # No await until the token is taken, so this runs atomically on the
+        # event loop without a lock. A negative balance reserves tokens for
+        # callers that are already waiting.
+        now = time.monotonic()
+        elapsed = now - self.last_update
+        self.tokens = min(self.burst_size, self.tokens + elapsed * self.rate) - 1
+        self.last_update = now
+        
+        if self.tokens < 0:
+            try:
+                await asyncio.sleep(-self.tokens / self.rate)
+            except asyncio.CancelledError:
+                # Give the reserved token back
+                self.tokens += 1
+                raise
     
     async def __aenter__(self):
         await self.acquire()
@@ -83,35 +85,38 @@ class SlidingWindowRateLimiter:
     def __init__(self, max_requests: int, window_seconds: int):
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self._requests: Dict[str, List[float]] = {}
-        self._lock = asyncio.Lock()
+        # key -> request timestamps (monotonic), oldest first. Checks never
+        # await, so they run atomically on the event loop without a lock.
+        self._requests: Dict[str, Deque[float]] = {}
     
     async def is_allowed(self, key: str) -> bool:
         """Check if request is allowed for the given key"""
-        async with self._lock:
-            now = time.time()
-            window_start = now - self.window_seconds
-            
-            # Get existing requests and filter to window
-            requests = self._requests.get(key, [])
-            requests = [t for t in requests if t > window_start]
-            
-            if len(requests) >= self.max_requests:
-                self._requests[key] = requests
-                return False
-            
-            requests.append(now)
-            self._requests[key] = requests
-            return True
+        now = time.monotonic()
+        window_start = now - self.window_seconds
+        
+        requests = self._requests.get(key)
+        if requests is None:
+            requests = self._requests[key] = deque()
+        
+        # Drop timestamps that slid out of the window
+        while requests and requests[0] <= window_start:
+            requests.popleft()
+        
+        if len(requests) >= self.max_requests:
+            return False
+        
+        requests.append(now)
+        return True
     
     async def get_remaining(self, key: str) -> int:
         """Get remaining requests for the key"""
-        async with self._lock:
-            now = time.time()
-            window_start = now - self.window_seconds
-            requests = self._requests.get(key, [])
-            requests = [t for t in requests if t > window_start]
-            return max(0, self.max_requests - len(requests))
+        window_start = time.monotonic() - self.window_seconds
+        requests = self._requests.get(key)
+        if not requests:
+            return self.max_requests
+        while requests and requests[0] <= window_start:
+            requests.popleft()
+        return max(0, self.max_requests - len(requests))
 
 
 # =============================================================================
@@ -205,7 +210,7 @@ async def retry_with_backoff(
 def verify_webhook_signature(
     payload: bytes,
     signature: str,
-    secret: str,
+    secret: Union[str, bytes],
     algorithm: str = "sha256"
 ) -> bool:
     """
@@ -218,21 +223,13 @@ def verify_webhook_signature(
             secret="webhook_secret"
         )
     """
-    if algorithm == "sha256":
-        expected = hmac.new(
-            secret.encode(),
-            payload,
-            hashlib.sha256
-        ).hexdigest()
-    elif algorithm == "sha1":
-        expected = hmac.new(
-            secret.encode(),
-            payload,
-            hashlib.sha1
-        ).hexdigest()
-    else:
+    if algorithm not in ("sha256", "sha1"):
         raise ValueError(f"Unsupported algorithm: {algorithm}")
     
+    # hmac.digest is a one-shot C fast path (no HMAC object)
+    key = secret.encode() if isinstance(secret, str) else secret
+    expected = hmac.digest(key, payload, algorithm).hex()
+    
     # Handle various signature formats
     if signature.startswith("sha256="):
         signature = signature[7:]
@@ -263,14 +260,20 @@ def flatten_dict(
     Example:
         {"a": {"b": 1}} -> {"a.b": 1}
     """
-    items = []
-    for key, value in d.items():
-        new_key = f"{parent_key}{separator}{key}" if parent_key else key
-        if isinstance(value, dict):
-            items.extend(flatten_dict(value, new_key, separator).items())
+    result = {}
+    # Stack of (prefix, items iterator); depth-first keeps the key order
+    stack = [(parent_key, iter(d.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for key, value in items:
+            new_key = f"{prefix}{separator}{key}" if prefix else key
+            if isinstance(value, dict):
+                stack.append((new_key, iter(value.items())))
+                break
+            result[new_key] = value
         else:
-            items.append((new_key, value))
-    return dict(items)
+            stack.pop()
+    return result
 
 
 def unflatten_dict(
@@ -299,11 +302,17 @@ def deep_merge(base: Dict, override: Dict) -> Dict:
     Override values take precedence.
     """
     result = base.copy()
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
-        else:
-            result[key] = value
+    # Nested dicts being merged are copied so neither input is mutated
+    stack = [(result, override)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                merged = target[key] = current.copy()
+                stack.append((merged, value))
+            else:
+                target[key] = value
     return result
 
 
@@ -345,19 +354,28 @@ async def gather_with_concurrency(
     """
     Execute tasks with limited concurrency.
     
+    Tasks may be awaitables or zero-argument async callables; callables
+    are only invoked once a slot is free, so pending work costs nothing.
+    
     Usage:
         results = await gather_with_concurrency(
-            [fetch(url) for url in urls],
+            [functools.partial(fetch, url) for url in urls],
             max_concurrent=5
         )
     """
+    tasks = list(tasks)
+    
+    # Everything fits at once: no semaphore or wrappers needed
+    if len(tasks) <= max_concurrent:
+        return await asyncio.gather(*(t() if callable(t) else t for t in tasks))
+    
     semaphore = asyncio.Semaphore(max_concurrent)
     
     async def limited_task(task):
         async with semaphore:
-            return await task
+            return await (task() if callable(task) else task)
     
-    return await asyncio.gather(*[limited_task(t) for t in tasks])
+    return await asyncio.gather(*map(limited_task, tasks))
 
 
 class AsyncBatcher:
@@ -385,46 +403,58 @@ class AsyncBatcher:
         self.max_wait_ms = max_wait_ms
         self._items: List = []
         self._futures: List[asyncio.Future] = []
-        self._lock = asyncio.Lock()
         self._timer_task: Optional[asyncio.Task] = None
+        # Running batch tasks, referenced so they are not garbage collected
+        self._batch_tasks: set = set()
     
     async def add(self, item: Any) -> Any:
         """Add item to batch and wait for result"""
-        future = asyncio.get_event_loop().create_future()
+        future = asyncio.get_running_loop().create_future()
         
-        async with self._lock:
-            self._items.append(item)
-            self._futures.append(future)
-            
-            if len(self._items) >= self.max_batch_size:
-                await self._flush()
-            elif self._timer_task is None:
-                self._timer_task = asyncio.create_task(self._timer())
+        # No await between reading and resetting the batch, so this is
+        # atomic on the event loop; the batch runs in its own task and
+        # never blocks callers filling the next one
+        self._items.append(item)
+        self._futures.append(future)
+        
+        if len(self._items) >= self.max_batch_size:
+            if self._timer_task is not None:
+                self._timer_task.cancel()
+                self._timer_task = None
+            task = asyncio.create_task(self._flush(*self._take_batch()))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+        elif self._timer_task is None:
+            self._timer_task = asyncio.create_task(self._timer())
         
         return await future
     
     async def _timer(self):
         """Timer to flush after max_wait_ms"""
         await asyncio.sleep(self.max_wait_ms / 1000)
-        async with self._lock:
-            if self._items:
-                await self._flush()
-            self._timer_task = None
+        self._timer_task = None
+        if self._items:
+            await self._flush(*self._take_batch())
     
-    async def _flush(self):
-        """Execute batch and resolve futures"""
+    def _take_batch(self) -> tuple:
+        """Detach the pending items and futures, starting a new batch"""
         items = self._items
         futures = self._futures
         self._items = []
         self._futures = []
-        
+        return items, futures
+    
+    async def _flush(self, items: List, futures: List[asyncio.Future]):
+        """Execute batch and resolve futures"""
         try:
             results = await self.batch_func(items)
             for future, result in zip(futures, results):
-                future.set_result(result)
+                if not future.done():
+                    future.set_result(result)
         except Exception as e:
             for future in futures:
-                future.set_exception(e)
+                if not future.done():
+                    future.set_exception(e)
 
 
 # =============================================================================
@@ -436,21 +466,53 @@ async def paginate_all(
     page_size: int = 100,
     max_pages: int = None,
     cursor_field: str = "cursor",
-    data_field: str = "data"
+    data_field: str = "data",
+    page_cursor: Optional[Callable[[int], Any]] = None,
+    concurrent_pages: int = 4
 ) -> List[Dict[str, Any]]:
     """
     Fetch all pages from a paginated API.
     
+    For offset/page-number APIs pass page_cursor, mapping a page index to
+    the cursor for that page; up to concurrent_pages pages are then fetched
+    at once, stopping at the first page shorter than page_size.
+    
     Usage:
         all_users = await paginate_all(
             lambda cursor: api.list_users(cursor=cursor, limit=100),
             max_pages=10
         )
+        
+        all_users = await paginate_all(
+            lambda offset: api.list_users(offset=offset, limit=100),
+            page_cursor=lambda page: page * 100
+        )
     """
     all_data = []
-    cursor = None
     page = 0
     
+    if page_cursor is not None:
+        while True:
+            count = concurrent_pages
+            if max_pages:
+                count = min(count, max_pages - page)
+            results = await asyncio.gather(
+                *(fetch_func(page_cursor(page + i)) for i in range(count))
+            )
+            for result in results:
+                data = result.get(data_field, [])
+                all_data.extend(data)
+                page += 1
+                # Pages fetched past the last one are discarded
+                if len(data) < page_size:
+                    return all_data
+            
+            if max_pages and page >= max_pages:
+                return all_data
+    
+    # Opaque cursors: each page depends on the previous response
+    cursor = None
+    
     while True:
         result = await fetch_func(cursor)
         
@@ -484,17 +546,23 @@ class AsyncCache:
         value = await cache.get("key")
     """
     
+    # Every SWEEP_EVERY-th set also evicts expired entries among the
+    # SWEEP_BATCH least recently set ones (SWEEP_EVERY is a power of two)
+    SWEEP_EVERY = 128
+    SWEEP_BATCH = 64
+    
     def __init__(self, default_ttl: int = 300):
         self.default_ttl = default_ttl
-        self._cache: Dict[str, tuple] = {}  # key -> (value, expires_at)
+        self._cache: Dict[str, tuple] = {}  # key -> (value, monotonic expires_at)
         self._lock = asyncio.Lock()
+        self._sweep_counter = 0
     
     async def get(self, key: str) -> Optional[Any]:
         """Get value if exists and not expired"""
         async with self._lock:
             if key in self._cache:
                 value, expires_at = self._cache[key]
-                if datetime.utcnow() < expires_at:
+                if time.monotonic() < expires_at:
                     return value
                 del self._cache[key]
             return None
@@ -502,9 +570,25 @@ class AsyncCache:
     async def set(self, key: str, value: Any, ttl: int = None):
         """Set value with TTL"""
         ttl = ttl or self.default_ttl
-        expires_at = datetime.utcnow() + timedelta(seconds=ttl)
+        expires_at = time.monotonic() + ttl
         async with self._lock:
+            # Re-insert so the dict stays ordered by last set
+            self._cache.pop(key, None)
             self._cache[key] = (value, expires_at)
+            self._maybe_sweep()
+    
+    def _maybe_sweep(self):
+        """Occasionally evict a few expired entries (caller holds the lock)"""
+        self._sweep_counter += 1
+        if self._sweep_counter & (self.SWEEP_EVERY - 1):
+            return
+        now = time.monotonic()
+        expired = [
+            k for k, (_, exp) in itertools.islice(self._cache.items(), self.SWEEP_BATCH)
+            if now >= exp
+        ]
+        for key in expired:
+            del self._cache[key]
     
     async def delete(self, key: str):
         """Delete a key"""
@@ -519,7 +603,7 @@ class AsyncCache:
     async def cleanup_expired(self):
         """Remove expired entries"""
         async with self._lock:
-            now = datetime.utcnow()
+            now = time.monotonic()
             expired = [k for k, (_, exp) in self._cache.items() if now >= exp]
             for key in expired:
                 del self._cache[key]